@@ -1,18 +1,38 @@
-from fastapi import FastAPI, HTTPException, UploadFile, File
+from fastapi import FastAPI, HTTPException, UploadFile, File, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 import os
-import json
+import asyncio
+import orjson
+import msgspec
+from pathlib import Path
 from striprtf.striprtf import rtf_to_text
 import tempfile
-from scripts.parsers import parse_context_files
+from scripts.parsers import parse_context_files, PARSER_VERSION, REQ_MAP
 import re
+import hashlib
+import threading
+from contextlib import asynccontextmanager
+import httpx
+import posixpath
+from httpx import AsyncClient, ASGITransport
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global _LOAD_TASK
+    _load_all_plans_from_disk()
+    # Keep a reference so the background load isn't garbage collected mid-parse
+    _LOAD_TASK = asyncio.create_task(_load_context_data_in_background())
+    yield
+
 
 app = FastAPI(
     title="Degree Planner API",
     description="API for Union Theological Seminary M.Div + Columbia MSSW dual degree planning",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Enable CORS for React frontend
@@ -53,6 +73,41 @@ class DegreePlan(BaseModel):
     courses: Dict[str, str] = {}  # course_code -> semester
     total_credits: int = 0
 
+class BatchSubRequest(BaseModel):
+    id: str
+    method: str = "GET"
+    url: str
+    body: Any = None
+
+class BatchRequest(BaseModel):
+    requests: List[BatchSubRequest]
+
+# msgspec mirrors of Course/Requirement used to validate and encode the catalog at load time.
+# Struct conversion + encoding is several times cheaper than the Pydantic round trip; the
+# Pydantic models above still describe the responses in the OpenAPI schema.
+class CourseRecord(msgspec.Struct):
+    code: str
+    title: str
+    credits: int
+    professor: str | None = None
+    schedule: list[str] | str | None = None
+    description: str | None = None
+    fields: list[str] = []
+    name: str | None = None
+    prerequisites: List[str] | None = None
+    corequisites: List[str] | None = None
+    semester_offered: List[str] | None = None
+    school: str | None = None
+
+class RequirementRecord(msgspec.Struct):
+    name: str
+    description: str
+    credits_required: int | None = None
+    courses: List[str] = []
+    sub_requirements: List['RequirementRecord'] = []
+
+_JSON_ENCODER = msgspec.json.Encoder()
+
 # Global data storage
 PARSED_DATA = {
     "courses": [],
@@ -65,6 +120,8 @@ PARSED_DATA = {
 
 # NEW_GLOBAL_STORAGE
 PLAN_STORAGE: Dict[str, DegreePlan] = {}
+# student_name -> serialized plan, kept in step with PLAN_STORAGE so reads skip re-encoding
+PLAN_JSON: Dict[str, bytes] = {}
 PLANS_DIR = os.path.join(os.path.dirname(__file__), "plans")
 os.makedirs(PLANS_DIR, exist_ok=True)
 
@@ -75,43 +132,133 @@ def _plan_file_path(student_name: str) -> str:
     return os.path.join(PLANS_DIR, f"{safe_name}.json")
 
 
-def _save_plan_to_disk(plan: DegreePlan):
-    file_path = _plan_file_path(plan.student_name)
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(plan.model_dump(), f, indent=2)
+def _cache_plan(student_name: str, plan: DegreePlan) -> bytes:
+    """Store a plan in memory along with its serialized JSON, which is returned"""
+    payload = plan.model_dump_json().encode()
+    PLAN_STORAGE[student_name] = plan
+    PLAN_JSON[student_name] = payload
+    return payload
+
+
+def _save_plan_to_disk(student_name: str, payload: bytes):
+    file_path = _plan_file_path(student_name)
+    # Write to a temp file and swap it in so a crash mid-write can't corrupt the saved plan
+    tmp_path = f"{file_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, file_path)
 
 
 def _load_plan_from_disk(student_name: str) -> Optional[DegreePlan]:
     file_path = _plan_file_path(student_name)
     if not os.path.exists(file_path):
         return None
-    with open(file_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = orjson.loads(Path(file_path).read_bytes())
     return DegreePlan(**data)
 
+
+def _load_all_plans_from_disk():
+    """Warm PLAN_STORAGE with every saved plan so it can serve listings on its own"""
+    try:
+        entries = list(os.scandir(PLANS_DIR))
+    except FileNotFoundError:
+        return  # No plans saved yet
+    for entry in entries:
+        if not entry.is_file() or not entry.name.endswith(".json"):
+            continue
+        try:
+            plan = DegreePlan(**orjson.loads(Path(entry.path).read_bytes()))
+        except Exception as e:
+            print(f"Warning: skipping unreadable plan file {entry.name}: {e}")
+            continue
+        if plan.student_name not in PLAN_STORAGE:
+            _cache_plan(plan.student_name, plan)
+
+
 # END_NEW_GLOBAL_STORAGE
 
 def load_context_data():
-    """Load and parse all files from the _context directory at startup"""
+    """Load and parse all files from the _context directory, then refresh the response cache"""
     global PARSED_DATA
-    
+    data = _parse_context_data()
+    _build_response_cache(data)
+    # Swap in one assignment so concurrent requests never see a half-built cache
+    PARSED_DATA = data
+
+
+# Parsed corpus cache, keyed by the names/sizes/mtimes of the source files
+PARSE_CACHE_DIR = os.path.join(os.path.dirname(__file__), ".cache")
+
+
+def _context_signature(context_dir: str) -> str:
+    """Hash the name, size and mtime of every PDF/RTF file in the context directory,
+    plus the parser version and requirement map"""
+    digest = hashlib.blake2b(digest_size=16)
+    # Parser changes alter the parsed data for unchanged files, so they invalidate the cache too
+    digest.update(repr((PARSER_VERSION, sorted(REQ_MAP.items()))).encode())
+    with os.scandir(context_dir) as entries:
+        for entry in sorted(entries, key=lambda e: e.name):
+            if entry.name.lower().endswith((".pdf", ".rtf")):
+                stat = entry.stat()
+                digest.update(f"{entry.name}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def _load_parse_cache(signature: str) -> Optional[Dict[str, Any]]:
+    cache_path = Path(PARSE_CACHE_DIR, f"parsed-{signature}.msgpack")
+    if not cache_path.exists():
+        return None
+    try:
+        return msgspec.msgpack.decode(cache_path.read_bytes())
+    except Exception as e:
+        print(f"Warning: ignoring unreadable parse cache {cache_path.name}: {e}")
+        return None
+
+
+def _save_parse_cache(signature: str, parsed_data: Dict[str, Any]):
+    os.makedirs(PARSE_CACHE_DIR, exist_ok=True)
+    cache_name = f"parsed-{signature}.msgpack"
+    cache_path = os.path.join(PARSE_CACHE_DIR, cache_name)
+    # Per-process temp name: parallel test workers may write the same cache entry
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(msgspec.msgpack.encode(parsed_data))
+    os.replace(tmp_path, cache_path)
+    # Entries for older versions of the context files can never be hit again
+    with os.scandir(PARSE_CACHE_DIR) as entries:
+        for entry in entries:
+            if entry.name.startswith("parsed-") and entry.name.endswith(".msgpack") and entry.name != cache_name:
+                try:
+                    os.remove(entry.path)
+                except FileNotFoundError:
+                    pass
+
+
+def _parse_context_data() -> Dict[str, Any]:
+    """Parse all files from the _context directory, keeping the current data on failure"""
     print("Loading and parsing files from _context directory...")
     
     # Check if _context directory exists
     context_dir = "../_context"
     if not os.path.exists(context_dir):
         print(f"Warning: {context_dir} directory not found. Using sample data.")
-        return
+        return dict(PARSED_DATA)
+    
+    # Reuse the previous parse if none of the source files changed
+    signature = _context_signature(context_dir)
+    parsed_data = _load_parse_cache(signature)
+    if parsed_data is not None:
+        print("Loaded parsed context data from cache")
+        return parsed_data
     
     # Parse all files
     parsed_data = parse_context_files(context_dir)
     
     if "error" in parsed_data:
         print(f"Error parsing context files: {parsed_data['error']}")
-        return
+        return dict(PARSED_DATA)
     
-    # Update global data
-    PARSED_DATA = parsed_data
+    _save_parse_cache(signature, parsed_data)
     
     print(f"Successfully parsed {parsed_data['total_files_processed']} files")
     print(f"Found {parsed_data['total_courses_found']} courses")
@@ -123,8 +270,7 @@ def load_context_data():
         for course in parsed_data['courses'][:3]:
             print(f"  - {course.get('code', 'N/A')}: {course.get('name', 'N/A')}")
 
-# Load data at startup
-load_context_data()
+    return parsed_data
 
 # Sample data (fallback if parsing fails)
 SAMPLE_COURSES = [
@@ -186,20 +332,45 @@ SAMPLE_REQUIREMENTS = [
     }
 ]
 
-@app.get("/")
-async def root():
-    return {"message": "Degree Planner API is running"}
-
-@app.get("/health")
-async def health_check():
-    return {"status": "healthy"}
 
-@app.get("/courses", response_model=List[Course])
-async def get_courses():
-    """Get all available courses with enriched metadata and requirement buckets"""
+def _int_credits(course: Dict[str, Any]) -> Any:
+    """Credits as the API's int; fractional parsed values (e.g. 1.5) are rounded with a warning"""
+    credits = course.get("credits", 0)
+    if isinstance(credits, float) and not credits.is_integer():
+        rounded = int(round(credits))
+        print(f"Warning: rounding {credits} credits of course {course.get('code', '?')} to {rounded}")
+        return rounded
+    return credits
+
+
+def _transform_course(course: Dict[str, Any], requirement_map: Dict[str, List[str]]) -> CourseRecord:
+    """Map a raw parsed/sample course onto the enriched Course structure"""
+    return msgspec.convert({
+        "code": course.get("code"),
+        "title": course.get("title") or course.get("name"),
+        "credits": _int_credits(course),
+        "professor": course.get("professor"),
+        "schedule": course.get("schedule") or course.get("semester_offered"),
+        "description": course.get("description", ""),
+        "fields": requirement_map.get(course.get("code"), []),
+        # legacy fields
+        "name": course.get("name"),
+        "prerequisites": course.get("prerequisites"),
+        "corequisites": course.get("corequisites"),
+        "semester_offered": course.get("semester_offered"),
+        "school": course.get("school"),
+    }, CourseRecord, strict=False)
+
+
+def _build_response_cache(data: Dict[str, Any]):
+    """Validate and serialize courses/requirements once so GET handlers only copy bytes.
+
+    The parsed data only changes on (re)load, so the per-request Pydantic validation and
+    JSON encoding of the old handlers was repeated work over static data.
+    """
     # Source course/raw requirement data (parsed or sample)
-    raw_courses = PARSED_DATA.get("courses", []) if PARSED_DATA.get("courses") else SAMPLE_COURSES
-    raw_requirements = PARSED_DATA.get("requirements", []) if PARSED_DATA.get("requirements") else SAMPLE_REQUIREMENTS
+    raw_courses = data.get("courses") or SAMPLE_COURSES
+    raw_requirements = data.get("requirements") or SAMPLE_REQUIREMENTS
 
     # Build mapping of course_code -> [requirement names]
     requirement_map: Dict[str, List[str]] = {}
@@ -207,71 +378,224 @@ async def get_courses():
         for code in req.get("courses", []):
             requirement_map.setdefault(code, []).append(req.get("name", ""))
 
-    transformed: List[Course] = []
+    # One malformed row must not take the whole catalog down, so bad rows are skipped
+    courses = []
     for course in raw_courses:
-        transformed.append(
-            Course(
-                code=course.get("code"),
-                title=course.get("title") or course.get("name"),
-                credits=course.get("credits", 0),
-                professor=course.get("professor"),
-                schedule=course.get("schedule") or course.get("semester_offered"),
-                description=course.get("description", ""),
-                fields=requirement_map.get(course.get("code"), []),
-                # legacy fields
-                name=course.get("name"),
-                prerequisites=course.get("prerequisites"),
-                corequisites=course.get("corequisites"),
-                semester_offered=course.get("semester_offered"),
-                school=course.get("school"),
-            )
-        )
+        try:
+            courses.append(_transform_course(course, requirement_map))
+        except msgspec.ValidationError as e:
+            print(f"Warning: skipping course {course.get('code', '?')}: {e}")
 
-    return transformed
+    requirements = []
+    for req in raw_requirements:
+        req = dict(req)
+        # Ensure credits_required is always an int
+        if not isinstance(req.get("credits_required"), int):
+            try:
+                req["credits_required"] = int(req.get("credits_required", 0) or 0)
+            except Exception:
+                req["credits_required"] = 0
+        try:
+            requirements.append(msgspec.convert(req, RequirementRecord, strict=False))
+        except msgspec.ValidationError as e:
+            print(f"Warning: skipping requirement {req.get('name', '?')}: {e}")
+
+    # course_code -> pre-serialized course; first occurrence wins, as with the old linear scan
+    code_index: Dict[str, bytes] = {}
+    for course in courses:
+        if course.code not in code_index:
+            code_index[course.code] = _JSON_ENCODER.encode(course)
+
+    data["_code_index"] = code_index
+    data["_courses_json"] = _JSON_ENCODER.encode(courses)
+    data["_requirements_json"] = _JSON_ENCODER.encode(requirements)
+    data["_parse_status_json"] = orjson.dumps({
+        "total_files_processed": data.get("total_files_processed", 0),
+        "total_courses_found": data.get("total_courses_found", 0),
+        "total_requirements_found": data.get("total_requirements_found", 0),
+        "parse_results": data.get("parse_results", []),
+        "using_parsed_data": len(data.get("courses", [])) > 0
+    })
+
+
+# Responses that never change are encoded once at import
+_ROOT_JSON = orjson.dumps({"message": "Degree Planner API is running"})
+_HEALTH_JSON = orjson.dumps({"status": "healthy"})
+_LOADING_JSON = orjson.dumps({"status": "loading"})
+_SAMPLE_DATA_JSON = orjson.dumps({
+    "courses": SAMPLE_COURSES,
+    "requirements": SAMPLE_REQUIREMENTS
+})
+
+
+# Parsing the context files is CPU-bound, so it runs in a worker thread after startup
+# instead of at import; data endpoints answer 503 until it has finished.
+DATA_READY = asyncio.Event()
+_LOAD_TASK: Optional[asyncio.Task] = None
+
+
+def load_sample_data():
+    """Serve the sample catalog when the context files can't be loaded"""
+    global PARSED_DATA
+    data = {
+        "courses": [],
+        "requirements": [],
+        "parse_results": [],
+        "total_files_processed": 0,
+        "total_courses_found": 0,
+        "total_requirements_found": 0
+    }
+    # Empty courses/requirements fall back to SAMPLE_COURSES/SAMPLE_REQUIREMENTS
+    _build_response_cache(data)
+    PARSED_DATA = data
+
+
+async def _load_context_data_in_background():
+    try:
+        await asyncio.to_thread(load_context_data)
+    except Exception as e:
+        print(f"Error loading context data, serving sample data instead: {e}")
+        load_sample_data()
+    finally:
+        # Endpoints must never wait on a load that has already failed
+        DATA_READY.set()
+
+
+def _require_data_ready():
+    if not DATA_READY.is_set():
+        raise HTTPException(status_code=503, detail="Course data is still loading")
+
+@app.get("/")
+async def root():
+    return Response(content=_ROOT_JSON, media_type="application/json")
+
+@app.get("/health")
+async def health_check():
+    if not DATA_READY.is_set():
+        return Response(content=_LOADING_JSON, status_code=503, media_type="application/json")
+    return Response(content=_HEALTH_JSON, media_type="application/json")
+
+@app.get("/courses", response_model=List[Course])
+async def get_courses():
+    """Get all available courses with enriched metadata and requirement buckets"""
+    _require_data_ready()
+    return Response(content=PARSED_DATA["_courses_json"], media_type="application/json")
 
 @app.get("/courses/{course_code}", response_model=Course)
 async def get_course(course_code: str):
     """Get a specific course by code with the enriched structure"""
-    # Re-use the logic from get_courses
-    all_courses = await get_courses()
-    for course in all_courses:
-        if course.code == course_code:
-            return course
-    raise HTTPException(status_code=404, detail="Course not found")
+    _require_data_ready()
+    course = PARSED_DATA["_code_index"].get(course_code)
+    if course is None:
+        raise HTTPException(status_code=404, detail="Course not found")
+    return Response(content=course, media_type="application/json")
 
 @app.get("/requirements", response_model=List[Requirement])
 def get_requirements():
-    requirements_data = PARSED_DATA.get('requirements', [])
-    # Ensure credits_required is always an int
-    for req in requirements_data:
-        if 'credits_required' not in req or not isinstance(req['credits_required'], int):
-            try:
-                req['credits_required'] = int(req.get('credits_required', 0) or 0)
-            except Exception:
-                req['credits_required'] = 0
-    return [Requirement(**req) for req in requirements_data]
+    _require_data_ready()
+    return Response(content=PARSED_DATA["_requirements_json"], media_type="application/json")
 
 @app.get("/parse-status")
 async def get_parse_status():
     """Get the status of file parsing"""
-    return {
-        "total_files_processed": PARSED_DATA.get("total_files_processed", 0),
-        "total_courses_found": PARSED_DATA.get("total_courses_found", 0),
-        "total_requirements_found": PARSED_DATA.get("total_requirements_found", 0),
-        "parse_results": PARSED_DATA.get("parse_results", []),
-        "using_parsed_data": len(PARSED_DATA.get("courses", [])) > 0
-    }
+    _require_data_ready()
+    # Rebuilt by load_context_data on every (re)load
+    return Response(content=PARSED_DATA["_parse_status_json"], media_type="application/json")
 
 @app.post("/reload-data")
 async def reload_data():
     """Reload and reparse all files from the _context directory"""
-    load_context_data()
+    await asyncio.to_thread(load_context_data)
     return {
         "message": "Data reloaded successfully",
         "total_courses_found": PARSED_DATA.get("total_courses_found", 0),
         "total_requirements_found": PARSED_DATA.get("total_requirements_found", 0)
     }
 
+# Uploads are read in 1 MiB chunks; the small default buffer means many more awaits for large RTFs
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+
+async def _read_upload(file: UploadFile) -> bytes:
+    """Read an uploaded file fully using large chunks"""
+    buf = bytearray()
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        buf.extend(chunk)
+    return bytes(buf)
+
+
+# Counting regex matches avoids allocating a throwaway list of every word just to take its length
+_WORD_RE = re.compile(r'\S+')
+
+
+def _count_words(text: str) -> int:
+    return sum(1 for _ in _WORD_RE.finditer(text))
+
+
+RTF_SUMMARY_CACHE_SIZE = 128
+# blake2b digest of the upload -> its summary, oldest entries evicted first. Only the
+# short summary is kept, and the lock guards it against concurrent to_thread workers
+_RTF_SUMMARY_CACHE: Dict[bytes, Dict[str, Any]] = {}
+_RTF_SUMMARY_LOCK = threading.Lock()
+
+
+def _rtf_bytes_to_text(rtf_content: bytes) -> str:
+    """Decode RTF bytes and convert them to plain text (CPU-bound, run off the event loop)"""
+    return rtf_to_text(rtf_content.decode('utf-8', errors='ignore'))
+
+
+def _summarize_rtf_content(rtf_content: bytes) -> Dict[str, Any]:
+    """Convert an RTF upload and keep only a 500-char preview and word count, so the full text is freed in the worker
+
+    Summaries are memoized by content hash, so re-uploading a file skips striprtf.
+    """
+    digest = hashlib.blake2b(rtf_content, digest_size=16).digest()
+    with _RTF_SUMMARY_LOCK:
+        summary = _RTF_SUMMARY_CACHE.get(digest)
+    if summary is not None:
+        return summary
+
+    plain_text = _rtf_bytes_to_text(rtf_content)
+    summary = {
+        "text_content": plain_text[:500] + "..." if len(plain_text) > 500 else plain_text,
+        "word_count": _count_words(plain_text),
+    }
+    with _RTF_SUMMARY_LOCK:
+        if len(_RTF_SUMMARY_CACHE) >= RTF_SUMMARY_CACHE_SIZE:
+            _RTF_SUMMARY_CACHE.pop(next(iter(_RTF_SUMMARY_CACHE), None), None)
+        _RTF_SUMMARY_CACHE[digest] = summary
+    return summary
+
+
+def _parse_rtf_content(filename: str, rtf_content: bytes) -> Dict[str, Any]:
+    """Convert an RTF upload to text and pull out "CODE - Name" course lines"""
+    plain_text = _rtf_bytes_to_text(rtf_content)
+
+    # Basic parsing logic (can be enhanced)
+    parsed_data = {
+        "filename": filename,
+        "text_content": plain_text,
+        "word_count": _count_words(plain_text),
+        "extracted_courses": [],
+        "extracted_requirements": []
+    }
+
+    # Simple course extraction (look for patterns like "COURSE CODE - Course Name")
+    lines = plain_text.split('\n')
+    for line in lines:
+        line = line.strip()
+        if ' - ' in line and len(line) > 10:
+            # Basic pattern matching for course codes
+            parts = line.split(' - ', 1)
+            if len(parts) == 2 and len(parts[0]) <= 10:
+                parsed_data["extracted_courses"].append({
+                    "code": parts[0].strip(),
+                    "name": parts[1].strip()
+                })
+
+    return parsed_data
+
+
 @app.post("/parse-rtf")
 async def parse_rtf(file: UploadFile = File(...)):
     """Parse RTF file and extract text content"""
@@ -279,114 +603,115 @@ async def parse_rtf(file: UploadFile = File(...)):
         raise HTTPException(status_code=400, detail="File must be an RTF file")
     
     try:
-        # Read RTF content
-        rtf_content = await file.read()
-        rtf_text = rtf_content.decode('utf-8', errors='ignore')
+        rtf_content = await _read_upload(file)
+        # Conversion and line scanning are pure Python; keep them off the event loop
+        return await asyncio.to_thread(_parse_rtf_content, file.filename, rtf_content)
         
-        # Convert RTF to plain text
-        plain_text = rtf_to_text(rtf_text)
-        
-        # Basic parsing logic (can be enhanced)
-        parsed_data = {
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error parsing RTF file: {str(e)}")
+
+async def _summarize_upload(file: UploadFile) -> Dict[str, Any]:
+    """Summarize one file of an RTF batch, reporting failures in the result"""
+    if not file.filename.endswith('.rtf'):
+        return {
             "filename": file.filename,
-            "text_content": plain_text,
-            "word_count": len(plain_text.split()),
-            "extracted_courses": [],
-            "extracted_requirements": []
+            "error": "File must be an RTF file"
         }
+    
+    try:
+        rtf_content = await _read_upload(file)
+        summary = await asyncio.to_thread(_summarize_rtf_content, rtf_content)
         
-        # Simple course extraction (look for patterns like "COURSE CODE - Course Name")
-        lines = plain_text.split('\n')
-        for line in lines:
-            line = line.strip()
-            if ' - ' in line and len(line) > 10:
-                # Basic pattern matching for course codes
-                parts = line.split(' - ', 1)
-                if len(parts) == 2 and len(parts[0]) <= 10:
-                    parsed_data["extracted_courses"].append({
-                        "code": parts[0].strip(),
-                        "name": parts[1].strip()
-                    })
-        
-        return parsed_data
-        
+        return {
+            "filename": file.filename,
+            **summary,
+            "status": "success"
+        }
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error parsing RTF file: {str(e)}")
+        return {
+            "filename": file.filename,
+            "error": str(e),
+            "status": "error"
+        }
 
 @app.post("/parse-rtf-batch")
 async def parse_rtf_batch(files: List[UploadFile] = File(...)):
-    """Parse multiple RTF files"""
-    results = []
-    
-    for file in files:
-        if not file.filename.endswith('.rtf'):
-            results.append({
-                "filename": file.filename,
-                "error": "File must be an RTF file"
-            })
-            continue
-        
-        try:
-            rtf_content = await file.read()
-            rtf_text = rtf_content.decode('utf-8', errors='ignore')
-            plain_text = rtf_to_text(rtf_text)
-            
-            results.append({
-                "filename": file.filename,
-                "text_content": plain_text[:500] + "..." if len(plain_text) > 500 else plain_text,
-                "word_count": len(plain_text.split()),
-                "status": "success"
-            })
-        except Exception as e:
-            results.append({
-                "filename": file.filename,
-                "error": str(e),
-                "status": "error"
-            })
-    
-    return {"results": results}
+    """Parse multiple RTF files concurrently"""
+    results = await asyncio.gather(*(_summarize_upload(file) for file in files))
+    return {"results": list(results)}
 
 @app.get("/sample-data")
 async def get_sample_data():
     """Get sample data for testing"""
-    return {
-        "courses": SAMPLE_COURSES,
-        "requirements": SAMPLE_REQUIREMENTS
-    }
+    return Response(content=_SAMPLE_DATA_JSON, media_type="application/json")
 
 @app.post("/plans", response_model=DegreePlan)
 async def save_plan(plan: DegreePlan):
     """Save or update a degree plan for a student"""
-    PLAN_STORAGE[plan.student_name] = plan
-    _save_plan_to_disk(plan)
-    return plan
+    # Serialize once and reuse the bytes for both the plan file and the response
+    payload = _cache_plan(plan.student_name, plan)
+    _save_plan_to_disk(plan.student_name, payload)
+    return Response(content=payload, media_type="application/json")
 
 
 @app.get("/plans/{student_name}", response_model=DegreePlan)
 async def get_plan(student_name: str):
     """Retrieve a saved degree plan by student name"""
     # Check in-memory first
-    if student_name in PLAN_STORAGE:
-        return PLAN_STORAGE[student_name]
+    if student_name in PLAN_JSON:
+        return Response(content=PLAN_JSON[student_name], media_type="application/json")
     # Fallback to disk
     plan = _load_plan_from_disk(student_name)
     if plan:
-        PLAN_STORAGE[student_name] = plan
-        return plan
+        return Response(content=_cache_plan(student_name, plan), media_type="application/json")
     raise HTTPException(status_code=404, detail="Degree plan not found")
 
 
 @app.get("/plans", response_model=List[str])
 async def list_plans():
     """List all student names that have saved plans"""
-    names = list(PLAN_STORAGE.keys())
-    # Include any plans that might exist on disk but not loaded yet
-    for filename in os.listdir(PLANS_DIR):
-        if filename.endswith(".json"):
-            name = filename[:-5]
-            if name not in names:
-                names.append(name)
-    return names
+    # PLAN_STORAGE is warmed from disk at startup and updated on every save
+    return list(PLAN_STORAGE)
+
+# Upper bound on sub-requests per /batch call (same limit as Microsoft Graph JSON batching)
+MAX_BATCH_REQUESTS = 20
+
+
+def _batch_item_path(url: str) -> Optional[str]:
+    """Normalized path a sub-request URL resolves to, or None if it names a scheme or host"""
+    parsed = httpx.URL(url)
+    if parsed.scheme or parsed.host:
+        return None
+    # Resolve "." / ".." segments and percent-escapes the way routing will see them
+    path = posixpath.normpath("/" + parsed.path.lstrip("/"))
+    return path.rstrip("/") or "/"
+
+
+async def _dispatch_batch_item(client: AsyncClient, item: BatchSubRequest) -> Dict[str, Any]:
+    response = await client.request(item.method.upper(), item.url, json=item.body)
+    if response.headers.get("content-type", "").startswith("application/json"):
+        body = orjson.loads(response.content)
+    else:
+        body = response.text
+    return {"id": item.id, "status": response.status_code, "body": body}
+
+
+@app.post("/batch")
+async def batch(batch_request: BatchRequest):
+    """Run several API requests in one round trip; sub-requests are dispatched concurrently in-process"""
+    if len(batch_request.requests) > MAX_BATCH_REQUESTS:
+        raise HTTPException(status_code=400, detail=f"A batch may contain at most {MAX_BATCH_REQUESTS} requests")
+    paths = [_batch_item_path(item.url) for item in batch_request.requests]
+    if any(path is None for path in paths):
+        raise HTTPException(status_code=400, detail="Batch sub-request URLs must be relative paths")
+    if any(path == "/batch" for path in paths):
+        raise HTTPException(status_code=400, detail="Batches cannot be nested")
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://batch") as client:
+        responses = await asyncio.gather(
+            *(_dispatch_batch_item(client, item) for item in batch_request.requests)
+        )
+    return {"responses": list(responses)}
 
 # Allow running with `python main.py` for local dev
 if __name__ == "__main__":
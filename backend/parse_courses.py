@@ -2,7 +2,9 @@ import os
 import re
 import json
 import pdfplumber
+import pypdfium2 as pdfium
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 
 # Example REQ_MAP (customize as needed)
 REQ_MAP = {
@@ -32,30 +34,66 @@ PDFS = [
 
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
+# Each worker process reopens the PDF, so small files are extracted serially
+MIN_PAGES_PER_WORKER = 8
+
+# Rows whose first column starts with a course code (e.g. BX101, NT201) begin a new course
+COURSE_CODE_RE = re.compile(r"^[A-Z]{2,4}\d{2,4}[A-Z]?")
+
+def _extract_rows_from_pages(pdf_path, page_numbers):
+    """
+    Extract rows from the given pages of a PDF. Opens the file itself so it can run in a worker process.
+    """
+    rows = []
+    # pdfplumber is kept for table detection; plain text comes from the much faster PDFium backend
+    text_pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        with pdfplumber.open(pdf_path) as pdf:
+            for page_number in page_numbers:
+                page = pdf.pages[page_number]
+                tables = page.extract_tables()
+                if tables and any(tables):
+                    for table in tables:
+                        for row in table:
+                            if any(cell and cell.strip() for cell in row):
+                                rows.append([cell.strip() if cell else "" for cell in row])
+                else:
+                    text = text_pdf[page_number].get_textpage().get_text_range()
+                    # Remove headers/footers/page numbers
+                    text = re.sub(r"Page \d+|Union Theological Seminary.*", "", text)
+                    for line in text.splitlines():
+                        if not line.strip():
+                            continue
+                        # Split on multiple spaces or tabs
+                        row = re.split(r"\t| {2,}", line)
+                        rows.append([cell.strip() for cell in row])
+    finally:
+        text_pdf.close()
+    return rows
+
 def extract_rows(pdf_path):
     """
     Extract rows from a PDF using tables if possible, else fallback to regex-splitting raw text.
     Returns a list of rows (each row is a list of columns).
+    Pages are independent, so for longer PDFs contiguous page ranges (at least
+    MIN_PAGES_PER_WORKER pages each) are extracted in parallel worker processes.
     """
+    # PDFium reads the page count without pdfplumber's layout parsing
+    text_pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        page_count = len(text_pdf)
+    finally:
+        text_pdf.close()
+    workers = min(page_count // MIN_PAGES_PER_WORKER, os.cpu_count() or 1)
+    if workers <= 1:
+        return _extract_rows_from_pages(pdf_path, range(page_count))
+
+    chunk_size = -(-page_count // workers)  # ceiling division
+    chunks = [range(start, min(start + chunk_size, page_count)) for start in range(0, page_count, chunk_size)]
     rows = []
-    with pdfplumber.open(pdf_path) as pdf:
-        for page in pdf.pages:
-            tables = page.extract_tables()
-            if tables and any(tables):
-                for table in tables:
-                    for row in table:
-                        if any(cell and cell.strip() for cell in row):
-                            rows.append([cell.strip() if cell else "" for cell in row])
-            else:
-                text = page.extract_text() or ""
-                # Remove headers/footers/page numbers
-                text = re.sub(r"Page \d+|Union Theological Seminary.*", "", text)
-                for line in text.splitlines():
-                    if not line.strip():
-                        continue
-                    # Split on multiple spaces or tabs
-                    row = re.split(r"\t| {2,}", line)
-                    rows.append([cell.strip() for cell in row])
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk_rows in executor.map(_extract_rows_from_pages, [pdf_path] * len(chunks), chunks):
+            rows.extend(chunk_rows)
     return rows
 
 def row_to_course(row):
@@ -73,6 +111,8 @@ def row_to_course(row):
         "fields": [],
         "delivery": "",
     }
+    # Continuation lines are collected here and joined once in parse_pdf_to_json
+    course["_desc_parts"] = [course["description"]]
     return course
 
 def assign_fields_and_tally(courses, req_map):
@@ -96,28 +136,30 @@ def parse_pdf_to_json(pdf_path, semester, req_map):
     last_course = None
     
     for row in rows:
-        # Skip empty rows
-        if not row or not any(cell.strip() for cell in row):
+        # Skip empty rows (isspace avoids allocating a stripped copy of every cell)
+        if not any(cell and not cell.isspace() for cell in row):
             continue
             
-        # Check if this looks like a course code (e.g., BX101, NT201, etc.)
-        first_col = row[0].strip() if row else ""
-        if re.match(r"^[A-Z]{2,4}\d{2,4}[A-Z]?", first_col):
+        # Check if this looks like a course code (e.g., BX101, NT201, etc.);
+        # the cheap first-character test skips the regex for most continuation rows
+        first_col = row[0].strip()
+        if first_col[:1].isupper() and COURSE_CODE_RE.match(first_col):
             course = row_to_course(row)
             courses.append(course)
             last_course = course
         elif last_course and first_col:
             # This might be a continuation of the previous course
             if len(row) > 1:
-                last_course["description"] += " " + " ".join(row).strip()
+                last_course["_desc_parts"].append(" ".join(row).strip())
             else:
-                last_course["description"] += " " + first_col
+                last_course["_desc_parts"].append(first_col)
     
     # Clean up descriptions and filter out invalid courses
     valid_courses = []
     for course in courses:
+        desc_parts = course.pop("_desc_parts")
         if course["code"] and course["title"]:  # Only include courses with both code and title
-            course["description"] = re.sub(r"\s+", " ", course["description"]).strip()
+            course["description"] = re.sub(r"\s+", " ", " ".join(desc_parts)).strip()
             valid_courses.append(course)
     
     totals = assign_fields_and_tally(valid_courses, req_map)
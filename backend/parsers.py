@@ -2,8 +2,53 @@ import os
 import re
 from typing import List, Dict, Any, Optional
 from striprtf.striprtf import rtf_to_text
-import PyPDF2
+import pypdfium2 as pdfium
 import io
+from concurrent.futures import ProcessPoolExecutor
+
+# Patterns are compiled once at import rather than on every line / helper call.
+# Non-empty lines, iterated lazily instead of materializing text.split('\n')
+_LINE_RE = re.compile(r'[^\n]+')
+# Words are counted by matching rather than by building a text.split() list
+_WORD_RE = re.compile(r'\S+')
+# Course lines, e.g. BIBL 101, SW501, NT 233E
+_COURSE_RE = re.compile(r'\b([A-Z]{2,4}\s?\d{3,4}[A-Z]?)\b[\s:–—-]+(.+?)(?:\s*\((\d+)\s*credits?\))?$', re.IGNORECASE)
+_VALID_CODE_RE = re.compile(r'^[A-Z]{2,4}\d{3,4}[A-Z]?$')
+# Lines that are just a year, an all-caps heading or a semester label
+_SKIP_LINE_RE = re.compile(r'^(?:(?:19|20)\d{2}|[A-Z ]{5,}|(?i:fall|spring|summer|winter)\s*\d{4})$')
+
+# Section headers. Each alternative is a lookahead anchored at the start of the line, so the
+# alternatives are tried in priority order (like successive searches) within a single match call.
+_REQUIREMENT_RE = re.compile(
+    r'(?=.*?(Core\s+Requirements?|Electives?|Required\s+Courses?|Program\s+Requirements?))'
+    r'|(?=.*?(Total\s+Credits?\s*:\s*\d+))'
+    r'|(?=.*?(\d+\s+credits?\s+required))',
+    re.IGNORECASE | re.DOTALL
+)
+
+_CREDIT_RES = [re.compile(p, re.IGNORECASE) for p in (
+    r'(\d+)\s*credits?',
+    r'\((\d+)\s*credits?\)',
+    r'(\d+)\s*credit\s*hours?',
+)]
+
+_PREREQ_RES = [re.compile(p, re.IGNORECASE) for p in (
+    r'prerequisite[s]?\s*:\s*([^.]+)',
+    r'prerequisite[s]?\s*\(([^)]+)\)',
+    r'prereq[s]?\s*:\s*([^.]+)',
+)]
+_PREREQ_CODE_RE = re.compile(r'[A-Z]{2,4}\s?\d{3,4}[A-Z]?')
+
+# School detection: UTS prefixes take precedence over Columbia ones
+_UTS_RE = re.compile(r'BIBL|THEO|HIST|ETH|MIN|PAST|LANG', re.IGNORECASE)
+_COLUMBIA_RE = re.compile(r'SW|SOC|PSYCH|POL|ECON', re.IGNORECASE)
+
+# Only a short excerpt of each file's text is kept on the parse result
+TEXT_PREVIEW_CHARS = 1000
+
+
+def _text_preview(text: str, limit: int = TEXT_PREVIEW_CHARS) -> str:
+    return text[:limit] + "..." if len(text) > limit else text
 
 class CourseParser:
     """Parser for extracting course information from RTF and PDF files"""
@@ -19,7 +64,7 @@ class CourseParser:
                 rtf_content = file.read()
             
             plain_text = rtf_to_text(rtf_content)
-            return self._extract_courses_from_text(plain_text, file_path)
+            return self._extract_courses_from_text(plain_text, file_path, _text_preview(plain_text))
         except Exception as e:
             return {
                 "filename": os.path.basename(file_path),
@@ -30,14 +75,14 @@ class CourseParser:
     def parse_pdf_file(self, file_path: str) -> Dict[str, Any]:
         """Parse a PDF file and extract course information"""
         try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                plain_text = ""
-                
-                for page in pdf_reader.pages:
-                    plain_text += page.extract_text() + "\n"
+            # PDFium (C++) extracts text far faster than the pure-Python PyPDF2 reader
+            pdf = pdfium.PdfDocument(file_path)
+            try:
+                plain_text = "".join(page.get_textpage().get_text_range() + "\n" for page in pdf)
+            finally:
+                pdf.close()
             
-            return self._extract_courses_from_text(plain_text, file_path)
+            return self._extract_courses_from_text(plain_text, file_path, _text_preview(plain_text))
         except Exception as e:
             return {
                 "filename": os.path.basename(file_path),
@@ -45,57 +90,43 @@ class CourseParser:
                 "status": "error"
             }
     
-    def _extract_courses_from_text(self, text: str, file_path: str) -> Dict[str, Any]:
-        """Extract course information from plain text"""
+    def _extract_courses_from_text(self, text: str, file_path: str, text_preview: Optional[str] = None) -> Dict[str, Any]:
+        """Extract course information from plain text
+
+        ``text_preview`` is the excerpt stored as ``text_content``; the full text is not retained.
+        """
         filename = os.path.basename(file_path)
         extracted_courses = []
         extracted_requirements = []
         
-        # Split text into lines for processing
-        lines = text.split('\n')
-        
-        # Improved course extraction pattern: e.g. BIBL 101, SW501, NT 233E
-        course_pattern = re.compile(r'\b([A-Z]{2,4}\s?\d{3,4}[A-Z]?)\b[\s:–—-]+(.+?)(?:\s*\((\d+)\s*credits?\))?$', re.IGNORECASE)
-        
-        # Requirement extraction patterns (unchanged for now)
-        requirement_patterns = [
-            r'(Core\s+Requirements?|Electives?|Required\s+Courses?|Program\s+Requirements?)',
-            r'(Total\s+Credits?\s*:\s*\d+)',
-            r'(\d+\s+credits?\s+required)',
-        ]
-        
         current_section = ""
         
-        for line in lines:
-            line = line.strip()
+        for line_match in _LINE_RE.finditer(text):
+            line = line_match.group(0).strip()
             if not line:
                 continue
             # Filter out lines that are all uppercase, years, or not likely to be courses
-            if line.isupper() or re.match(r'^(19|20)\d{2}$', line) or re.match(r'^[A-Z ]{5,}$', line):
-                continue
-            # Filter out lines that are just a year or semester
-            if re.match(r'^(fall|spring|summer|winter)\s*\d{4}$', line, re.IGNORECASE):
+            # (str.isupper is a cheap C-level check, so it runs before the regex)
+            if line.isupper() or _SKIP_LINE_RE.match(line):
                 continue
             # Check for section headers
-            for pattern in requirement_patterns:
-                match = re.search(pattern, line, re.IGNORECASE)
-                if match:
-                    current_section = match.group(1)
-                    extracted_requirements.append({
-                        "name": current_section,
-                        "description": line,
-                        "credits_required": self._extract_credits(line),
-                        "courses": []
-                    })
-                    break
+            match = _REQUIREMENT_RE.match(line)
+            if match:
+                current_section = match.group(match.lastindex)
+                extracted_requirements.append({
+                    "name": current_section,
+                    "description": line,
+                    "credits_required": self._extract_credits(line),
+                    "courses": []
+                })
             # Check for course pattern
-            match = course_pattern.search(line)
+            match = _COURSE_RE.search(line)
             if match:
                 course_code = match.group(1).replace(' ', '').upper()
                 course_name = match.group(2).strip()
                 credits = match.group(3) if match.group(3) else self._extract_credits(line)
                 # Filter out junk course codes (e.g., codes that are not at least 2 letters + 3 digits)
-                if not re.match(r'^[A-Z]{2,4}\d{3,4}[A-Z]?$', course_code):
+                if not _VALID_CODE_RE.match(course_code):
                     continue
                 # Determine school based on course code or filename
                 school = self._determine_school(course_code, filename)
@@ -117,8 +148,8 @@ class CourseParser:
                     extracted_requirements[-1]["courses"].append(course_code)
         return {
             "filename": filename,
-            "text_content": text[:1000] + "..." if len(text) > 1000 else text,
-            "word_count": len(text.split()),
+            "text_content": text_preview if text_preview is not None else _text_preview(text),
+            "word_count": sum(1 for _ in _WORD_RE.finditer(text)),
             "extracted_courses": extracted_courses,
             "extracted_requirements": extracted_requirements,
             "status": "success"
@@ -126,14 +157,8 @@ class CourseParser:
     
     def _extract_credits(self, text: str) -> Optional[int]:
         """Extract credit information from text"""
-        credit_patterns = [
-            r'(\d+)\s*credits?',
-            r'\((\d+)\s*credits?\)',
-            r'(\d+)\s*credit\s*hours?',
-        ]
-        
-        for pattern in credit_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _CREDIT_RES:
+            match = pattern.search(text)
             if match:
                 return int(match.group(1))
         return None
@@ -149,40 +174,22 @@ class CourseParser:
     
     def _extract_prerequisites(self, text: str) -> List[str]:
         """Extract prerequisites from text"""
-        prereq_patterns = [
-            r'prerequisite[s]?\s*:\s*([^.]+)',
-            r'prerequisite[s]?\s*\(([^)]+)\)',
-            r'prereq[s]?\s*:\s*([^.]+)',
-        ]
-        
-        for pattern in prereq_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _PREREQ_RES:
+            match = pattern.search(text)
             if match:
                 prereq_text = match.group(1)
                 # Extract course codes from prerequisite text
-                course_codes = re.findall(r'[A-Z]{2,4}\s?\d{3,4}[A-Z]?', prereq_text)
+                course_codes = _PREREQ_CODE_RE.findall(prereq_text)
                 return [code.strip() for code in course_codes]
         return []
     
     def _determine_school(self, course_code: str, filename: str) -> str:
         """Determine which school a course belongs to"""
-        # UTS course patterns
-        uts_patterns = [
-            r'BIBL', r'THEO', r'HIST', r'ETH', r'MIN', r'PAST', r'LANG'
-        ]
-        
-        # Columbia course patterns
-        columbia_patterns = [
-            r'SW', r'SOC', r'PSYCH', r'POL', r'ECON'
-        ]
-        
-        for pattern in uts_patterns:
-            if re.search(pattern, course_code, re.IGNORECASE):
-                return "UTS"
+        if _UTS_RE.search(course_code):
+            return "UTS"
         
-        for pattern in columbia_patterns:
-            if re.search(pattern, course_code, re.IGNORECASE):
-                return "Columbia"
+        if _COLUMBIA_RE.search(course_code):
+            return "Columbia"
         
         # Default based on filename
         if 'MDiv' in filename or 'UTS' in filename:
@@ -205,11 +212,54 @@ class CourseParser:
         else:
             return ["Fall", "Spring"]  # Default to both semesters
 
+def _parse_pdf_worker(file_path: str) -> Dict[str, Any]:
+    """Process-pool entry point: parse one PDF in a fresh CourseParser"""
+    return CourseParser().parse_pdf_file(file_path)
+
+
+def _parse_pdf_files(file_paths: List[str]) -> List[Dict[str, Any]]:
+    """Parse PDFs in parallel worker processes; PDF text extraction is CPU-bound and holds the GIL"""
+    if len(file_paths) <= 1:
+        return [_parse_pdf_worker(path) for path in file_paths]
+    workers = min(len(file_paths), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_parse_pdf_worker, file_paths))
+
+
+def _merge_unique(result: Dict[str, Any], unique_courses: Dict[str, Any], unique_requirements: Dict[str, Any]):
+    """Fold a successful parse result into the dedup maps; the first course code / requirement name wins"""
+    if result.get("status") != "success":
+        return
+    for course in result.get("extracted_courses", ()):
+        code = course.get("code", "")
+        if code:
+            unique_courses.setdefault(code, course)
+    for req in result.get("extracted_requirements", ()):
+        name = req.get("name", "")
+        if name:
+            unique_requirements.setdefault(name, req)
+
+
+def _parse_result_summary(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Metadata kept per file in parse_results; text previews and extracted rows are dropped so
+    the long-lived parse results don't grow with the corpus"""
+    summary = {
+        "filename": result.get("filename"),
+        "status": result.get("status"),
+        "word_count": result.get("word_count", 0),
+        "n_courses": len(result.get("extracted_courses", ())),
+        "n_requirements": len(result.get("extracted_requirements", ())),
+    }
+    if "error" in result:
+        summary["error"] = result["error"]
+    return summary
+
+
 def parse_context_files(context_dir: str = "_context") -> Dict[str, Any]:
     """Parse all RTF and PDF files in the context directory"""
     parser = CourseParser()
-    all_courses = []
-    all_requirements = []
+    unique_courses: Dict[str, Any] = {}
+    unique_requirements: Dict[str, Any] = {}
     parse_results = []
     
     if not os.path.exists(context_dir):
@@ -219,49 +269,32 @@ def parse_context_files(context_dir: str = "_context") -> Dict[str, Any]:
             "requirements": []
         }
     
-    # Get all RTF and PDF files
-    rtf_files = [f for f in os.listdir(context_dir) if f.endswith('.rtf')]
-    pdf_files = [f for f in os.listdir(context_dir) if f.endswith('.pdf')]
+    # Get all RTF and PDF files in a single directory pass
+    rtf_paths = []
+    pdf_paths = []
+    with os.scandir(context_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith('.rtf'):
+                rtf_paths.append(entry.path)
+            elif entry.name.endswith('.pdf'):
+                pdf_paths.append(entry.path)
     
     # Parse RTF files
-    for rtf_file in rtf_files:
-        file_path = os.path.join(context_dir, rtf_file)
+    for file_path in rtf_paths:
         result = parser.parse_rtf_file(file_path)
-        parse_results.append(result)
-        
-        if result.get("status") == "success":
-            all_courses.extend(result.get("extracted_courses", []))
-            all_requirements.extend(result.get("extracted_requirements", []))
+        parse_results.append(_parse_result_summary(result))
+        _merge_unique(result, unique_courses, unique_requirements)
     
-    # Parse PDF files
-    for pdf_file in pdf_files:
-        file_path = os.path.join(context_dir, pdf_file)
-        result = parser.parse_pdf_file(file_path)
-        parse_results.append(result)
-        
-        if result.get("status") == "success":
-            all_courses.extend(result.get("extracted_courses", []))
-            all_requirements.extend(result.get("extracted_requirements", []))
-    
-    # Remove duplicate courses based on course code
-    unique_courses = {}
-    for course in all_courses:
-        code = course.get("code", "")
-        if code and code not in unique_courses:
-            unique_courses[code] = course
-    
-    # Remove duplicate requirements based on name
-    unique_requirements = {}
-    for req in all_requirements:
-        name = req.get("name", "")
-        if name and name not in unique_requirements:
-            unique_requirements[name] = req
+    # Parse PDF files (in parallel, results kept in file order)
+    for result in _parse_pdf_files(pdf_paths):
+        parse_results.append(_parse_result_summary(result))
+        _merge_unique(result, unique_courses, unique_requirements)
     
     return {
         "parse_results": parse_results,
         "courses": list(unique_courses.values()),
         "requirements": list(unique_requirements.values()),
-        "total_files_processed": len(rtf_files) + len(pdf_files),
+        "total_files_processed": len(rtf_paths) + len(pdf_paths),
         "total_courses_found": len(unique_courses),
         "total_requirements_found": len(unique_requirements)
-    } 
\ No newline at end of file
+    }
\ No newline at end of file
@@ -1,28 +1,56 @@
 import pytest
-from fastapi.testclient import TestClient
+import pytest_asyncio
+import asyncio
+from httpx import AsyncClient, ASGITransport
+import main
 from main import app
 import io
+import time
 
-client = TestClient(app)
+@pytest.fixture(scope="session")
+def event_loop():
+    """One event loop for the whole session so the shared async client can be reused"""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
 
-def test_root():
+@pytest_asyncio.fixture(scope="session")
+async def aclient():
+    """Shared in-process ASGI client: runs the app lifespan once and waits for the data load"""
+    async with app.router.lifespan_context(app):
+        await asyncio.wait_for(main.DATA_READY.wait(), timeout=30)
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            yield client
+
+@pytest_asyncio.fixture(scope="session")
+async def courses_response(aclient):
+    """GET /courses, fetched once and shared by the course tests"""
+    return await aclient.get("/courses")
+
+@pytest_asyncio.fixture(scope="session")
+async def requirements_response(aclient):
+    """GET /requirements, fetched once and shared by the requirement tests"""
+    return await aclient.get("/requirements")
+
+@pytest.mark.asyncio
+async def test_root(aclient):
     """Test root endpoint"""
-    response = client.get("/")
+    response = await aclient.get("/")
     assert response.status_code == 200
     assert "message" in response.json()
     assert "running" in response.json()["message"]
 
-def test_health():
+@pytest.mark.asyncio
+async def test_health(aclient):
     """Test health check endpoint"""
-    response = client.get("/health")
+    response = await aclient.get("/health")
     assert response.status_code == 200
     assert response.json() == {"status": "healthy"}
 
-def test_get_courses():
+def test_get_courses(courses_response):
     """Test getting all courses"""
-    response = client.get("/courses")
-    assert response.status_code == 200
-    courses = response.json()
+    assert courses_response.status_code == 200
+    courses = courses_response.json()
     assert isinstance(courses, list)
     assert len(courses) > 0
     
@@ -34,25 +62,53 @@ def test_get_courses():
     assert "description" in first_course
     assert "school" in first_course
 
-def test_get_specific_course():
+@pytest.mark.asyncio
+async def test_data_endpoints_unavailable_while_loading(aclient, monkeypatch):
+    """Test that data endpoints report 503 until the startup load completes"""
+    monkeypatch.setattr(main, "DATA_READY", main.asyncio.Event())
+    assert (await aclient.get("/health")).status_code == 503
+    assert (await aclient.get("/courses")).status_code == 503
+    assert (await aclient.get("/requirements")).status_code == 503
+
+@pytest.mark.asyncio
+async def test_failed_load_falls_back_to_sample_data(aclient, monkeypatch):
+    """Test that a failing context load still marks the data ready, serving the sample catalog"""
+    def failing_parse():
+        raise OSError("read-only cache directory")
+
+    monkeypatch.setattr(main, "_parse_context_data", failing_parse)
+    monkeypatch.setattr(main, "DATA_READY", main.asyncio.Event())
+    monkeypatch.setattr(main, "PARSED_DATA", main.PARSED_DATA)
+    await main._load_context_data_in_background()
+
+    assert main.DATA_READY.is_set()
+    assert (await aclient.get("/health")).status_code == 200
+    response = await aclient.get("/courses")
+    assert response.status_code == 200
+    assert {c["code"] for c in response.json()} == {c["code"] for c in main.SAMPLE_COURSES}
+
+@pytest.mark.asyncio
+async def test_get_specific_course(aclient, courses_response):
     """Test getting a specific course"""
-    response = client.get("/courses/BIBL101")
+    response = await aclient.get("/courses/BIBL101")
     assert response.status_code == 200
     course = response.json()
     assert course["code"] == "BIBL101"
     assert course["name"] == "Introduction to Biblical Studies"
+    # Same record as in the full listing
+    assert course == next(c for c in courses_response.json() if c["code"] == "BIBL101")
 
-def test_get_nonexistent_course():
+@pytest.mark.asyncio
+async def test_get_nonexistent_course(aclient):
     """Test getting a course that doesn't exist"""
-    response = client.get("/courses/NONEXISTENT")
+    response = await aclient.get("/courses/NONEXISTENT")
     assert response.status_code == 404
     assert "not found" in response.json()["detail"]
 
-def test_get_requirements():
+def test_get_requirements(requirements_response):
     """Test getting all requirements"""
-    response = client.get("/requirements")
-    assert response.status_code == 200
-    requirements = response.json()
+    assert requirements_response.status_code == 200
+    requirements = requirements_response.json()
     assert isinstance(requirements, list)
     assert len(requirements) > 0
     
@@ -62,9 +118,10 @@ def test_get_requirements():
     assert "description" in first_req
     assert "credits_required" in first_req
 
-def test_get_sample_data():
+@pytest.mark.asyncio
+async def test_get_sample_data(aclient):
     """Test getting all sample data"""
-    response = client.get("/sample-data")
+    response = await aclient.get("/sample-data")
     assert response.status_code == 200
     data = response.json()
     assert "courses" in data
@@ -72,39 +129,68 @@ def test_get_sample_data():
     assert isinstance(data["courses"], list)
     assert isinstance(data["requirements"], list)
 
-def test_parse_rtf_single():
-    """Test parsing a single RTF file"""
-    # Create a simple RTF file content
-    rtf_content = r"{\rtf1\ansi\deff0 {\fonttbl {\f0 Times New Roman;}}\f0\fs24 Test Course - BIBL101 - Introduction to Biblical Studies}"
-    
-    # Create file-like object
-    file_content = io.BytesIO(rtf_content.encode('utf-8'))
-    
-    response = client.post(
-        "/parse-rtf",
-        files={"file": ("test.rtf", file_content, "application/rtf")}
-    )
-    
+@pytest.mark.asyncio
+async def test_batch(aclient):
+    """Test fetching several endpoints in one batch and checking them against each other"""
+    response = await aclient.post("/batch", json={"requests": [
+        {"id": "courses", "url": "/courses"},
+        {"id": "requirements", "url": "/requirements"},
+        {"id": "sample", "url": "/sample-data"},
+        {"id": "course", "url": "/courses/BIBL101"},
+        {"id": "missing", "url": "/courses/NONEXISTENT"},
+    ]})
     assert response.status_code == 200
-    result = response.json()
-    assert "filename" in result
-    assert "text_content" in result
-    assert "word_count" in result
-    assert result["filename"] == "test.rtf"
+    results = {r["id"]: r for r in response.json()["responses"]}
+    assert [results[i]["status"] for i in ("courses", "requirements", "sample", "course", "missing")] == [200, 200, 200, 200, 404]
 
-def test_parse_rtf_invalid_file():
-    """Test parsing with non-RTF file"""
-    file_content = io.BytesIO(b"This is not an RTF file")
-    
-    response = client.post(
+    courses = results["courses"]["body"]
+    assert results["course"]["body"] in courses
+    # Every course a requirement lists shows that requirement in its fields
+    by_code = {c["code"]: c for c in courses}
+    for req in results["requirements"]["body"]:
+        for code in req["courses"]:
+            if code in by_code:
+                assert req["name"] in by_code[code]["fields"]
+    assert {c["code"] for c in results["sample"]["body"]["courses"]} <= set(by_code)
+
+@pytest.mark.asyncio
+async def test_batch_rejects_nested_batches(aclient):
+    """Test that a batch cannot contain another batch"""
+    response = await aclient.post("/batch", json={"requests": [{"id": "1", "method": "POST", "url": "/batch"}]})
+    assert response.status_code == 400
+
+@pytest.mark.parametrize("url", ["http://t/batch", "//t/batch", "/courses/../batch/", "/%62atch"])
+@pytest.mark.asyncio
+async def test_batch_rejects_disguised_nested_batches(aclient, url):
+    """Test that absolute, scheme-relative and non-normalized batch URLs are rejected too"""
+    response = await aclient.post("/batch", json={"requests": [{"id": "1", "method": "POST", "url": url}]})
+    assert response.status_code == 400
+
+RTF_CONTENT = r"{\rtf1\ansi\deff0 {\fonttbl {\f0 Times New Roman;}}\f0\fs24 Test Course - BIBL101 - Introduction to Biblical Studies}".encode('utf-8')
+
+@pytest.mark.parametrize("filename,media_type,content,expected_status", [
+    ("test.rtf", "application/rtf", RTF_CONTENT, 200),
+    ("test.txt", "text/plain", b"This is not an RTF file", 400),
+])
+@pytest.mark.asyncio
+async def test_parse_rtf_upload(aclient, filename, media_type, content, expected_status):
+    """Test parsing a single upload: RTF files are parsed, other files are rejected"""
+    response = await aclient.post(
         "/parse-rtf",
-        files={"file": ("test.txt", file_content, "text/plain")}
+        files={"file": (filename, io.BytesIO(content), media_type)}
     )
     
-    assert response.status_code == 400
-    assert "RTF file" in response.json()["detail"]
+    assert response.status_code == expected_status
+    result = response.json()
+    if expected_status == 200:
+        assert "text_content" in result
+        assert "word_count" in result
+        assert result["filename"] == filename
+    else:
+        assert "RTF file" in result["detail"]
 
-def test_parse_rtf_batch():
+@pytest.mark.asyncio
+async def test_parse_rtf_batch(aclient):
     """Test parsing multiple RTF files"""
     # Create multiple RTF files
     rtf1 = r"{\rtf1\ansi\deff0 {\fonttbl {\f0 Times New Roman;}}\f0\fs24 Course 1 - THEO201}"
@@ -113,7 +199,7 @@ def test_parse_rtf_batch():
     file1 = io.BytesIO(rtf1.encode('utf-8'))
     file2 = io.BytesIO(rtf2.encode('utf-8'))
     
-    response = client.post(
+    response = await aclient.post(
         "/parse-rtf-batch",
         files=[
             ("files", ("file1.rtf", file1, "application/rtf")),
@@ -131,7 +217,51 @@ def test_parse_rtf_batch():
         assert "status" in file_result
         assert file_result["status"] == "success"
 
-def test_parse_rtf_batch_mixed_files():
+@pytest.mark.asyncio
+async def test_parse_rtf_batch_parallel(aclient, monkeypatch):
+    """Test that batch files are parsed concurrently rather than one after another"""
+    delay = 0.2
+    summarize = main._summarize_rtf_content
+    
+    def slow_summarize(rtf_content):
+        time.sleep(delay)
+        return summarize(rtf_content)
+    
+    monkeypatch.setattr(main, "_summarize_rtf_content", slow_summarize)
+    rtf = r"{\rtf1\ansi\deff0 {\fonttbl {\f0 Times New Roman;}}\f0\fs24 Course - THEO201}"
+    files = [("files", (f"file{i}.rtf", io.BytesIO(rtf.encode('utf-8')), "application/rtf")) for i in range(8)]
+    
+    start = time.perf_counter()
+    response = await aclient.post("/parse-rtf-batch", files=files)
+    elapsed = time.perf_counter() - start
+    
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [r["filename"] for r in results] == [f"file{i}.rtf" for i in range(8)]
+    assert all(r["status"] == "success" for r in results)
+    assert elapsed < 8 * delay
+
+def test_rtf_summary_is_memoized(monkeypatch):
+    """Test that summarizing the same RTF bytes twice only runs striprtf once"""
+    calls = []
+    
+    def counting_rtf_to_text(text):
+        calls.append(text)
+        return "converted text"
+    
+    monkeypatch.setattr(main, "rtf_to_text", counting_rtf_to_text)
+    monkeypatch.setattr(main, "_RTF_SUMMARY_CACHE", {})
+    rtf = rb"{\rtf1\ansi Memo test}"
+    
+    expected = {"text_content": "converted text", "word_count": 2}
+    assert main._summarize_rtf_content(rtf) == expected
+    assert main._summarize_rtf_content(rtf) == expected
+    assert len(calls) == 1
+    # Only the summary is cached, never the full text
+    assert list(main._RTF_SUMMARY_CACHE.values()) == [expected]
+
+@pytest.mark.asyncio
+async def test_parse_rtf_batch_mixed_files(aclient):
     """Test parsing batch with mixed file types"""
     rtf_content = r"{\rtf1\ansi\deff0 {\fonttbl {\f0 Times New Roman;}}\f0\fs24 Test content}"
     txt_content = b"This is a text file"
@@ -139,7 +269,7 @@ def test_parse_rtf_batch_mixed_files():
     rtf_file = io.BytesIO(rtf_content.encode('utf-8'))
     txt_file = io.BytesIO(txt_content)
     
-    response = client.post(
+    response = await aclient.post(
         "/parse-rtf-batch",
         files=[
             ("files", ("valid.rtf", rtf_file, "application/rtf")),
@@ -159,41 +289,93 @@ def test_parse_rtf_batch_mixed_files():
     txt_result = next(r for r in result["results"] if r["filename"] == "invalid.txt")
     assert "error" in txt_result
 
-def test_course_data_structure():
-    """Test that course data has correct structure"""
-    response = client.get("/courses")
-    courses = response.json()
-    
-    for course in courses:
-        # Check required fields
-        assert isinstance(course["code"], str)
-        assert isinstance(course["name"], str)
-        assert isinstance(course["credits"], int)
-        assert isinstance(course["description"], str)
-        assert isinstance(course["school"], str)
-        
-        # Check optional fields
-        assert isinstance(course["prerequisites"], list)
-        assert isinstance(course["corequisites"], list)
-        assert isinstance(course["semester_offered"], list)
-        
-        # Check school values
-        assert course["school"] in ["UTS", "Columbia"]
-
-def test_requirement_data_structure():
-    """Test that requirement data has correct structure"""
-    response = client.get("/requirements")
-    requirements = response.json()
-    
-    for req in requirements:
-        # Check required fields
-        assert isinstance(req["name"], str)
-        assert isinstance(req["description"], str)
-        assert isinstance(req["credits_required"], int)
-        
-        # Check optional fields
-        assert isinstance(req["courses"], list)
-        assert isinstance(req["sub_requirements"], list)
+@pytest.fixture(scope="session")
+def courses(courses_response):
+    return courses_response.json()
+
+@pytest.fixture(scope="session")
+def requirements(requirements_response):
+    return requirements_response.json()
+
+@pytest.mark.parametrize("field,typ", [
+    # Required fields
+    ("code", str),
+    ("name", str),
+    ("credits", int),
+    ("description", str),
+    ("school", str),
+    # Optional fields
+    ("prerequisites", list),
+    ("corequisites", list),
+    ("semester_offered", list),
+])
+def test_course_field_types(courses, field, typ):
+    """Test that every course field has the expected type"""
+    assert all(isinstance(course[field], typ) for course in courses)
+
+def test_course_school_values(courses):
+    """Test that every course belongs to a known school"""
+    assert all(course["school"] in ["UTS", "Columbia"] for course in courses)
+
+@pytest.mark.parametrize("field,typ", [
+    # Required fields
+    ("name", str),
+    ("description", str),
+    ("credits_required", int),
+    # Optional fields
+    ("courses", list),
+    ("sub_requirements", list),
+])
+def test_requirement_field_types(requirements, field, typ):
+    """Test that every requirement field has the expected type"""
+    assert all(isinstance(req[field], typ) for req in requirements)
+
+def test_parse_cache_round_trip(tmp_path, monkeypatch):
+    """Test that parsed context data is reused until the source files change"""
+    context_dir = tmp_path / "context"
+    context_dir.mkdir()
+    (context_dir / "catalog.rtf").write_text("BIBL101 - Intro")
+    monkeypatch.setattr(main, "PARSE_CACHE_DIR", str(tmp_path / "cache"))
+
+    signature = main._context_signature(str(context_dir))
+    assert main._load_parse_cache(signature) is None
+    data = {"courses": [{"code": "BIBL101", "credits": 3}], "requirements": []}
+    main._save_parse_cache(signature, data)
+    assert main._load_parse_cache(signature) == data
+
+    (context_dir / "catalog.rtf").write_text("BIBL101 - Introduction to the Bible")
+    assert main._context_signature(str(context_dir)) != signature
+
+    # A parser version bump invalidates entries for unchanged files
+    edited = main._context_signature(str(context_dir))
+    monkeypatch.setattr(main, "PARSER_VERSION", main.PARSER_VERSION + 1)
+    assert main._context_signature(str(context_dir)) != edited
+
+
+def test_saved_plans_load_at_startup(tmp_path, monkeypatch):
+    """Test that saved plans are read by the startup hook, and a missing plans directory is empty"""
+    monkeypatch.setattr(main, "PLAN_STORAGE", {})
+    monkeypatch.setattr(main, "PLAN_JSON", {})
+    monkeypatch.setattr(main, "PLANS_DIR", str(tmp_path / "missing"))
+    main._load_all_plans_from_disk()
+    assert main.PLAN_STORAGE == {}
+
+    monkeypatch.setattr(main, "PLANS_DIR", str(tmp_path))
+    (tmp_path / "Ada.json").write_text('{"student_name": "Ada", "start_semester": "Fall 2025"}')
+    main._load_all_plans_from_disk()
+    assert main.PLAN_STORAGE["Ada"].start_semester == "Fall 2025"
+
+
+def test_response_cache_tolerates_odd_course_rows():
+    """Test that fractional credits are coerced and invalid rows skipped instead of failing the build"""
+    data = {"courses": [
+        {"code": "SW 501", "title": "Practice", "credits": 1.5},
+        {"code": "SW 502", "title": "Policy", "credits": 3.0},
+        {"code": None, "title": "No code", "credits": 3},
+    ]}
+    main._build_response_cache(data)
+    courses = main.orjson.loads(data["_courses_json"])
+    assert [(c["code"], c["credits"]) for c in courses] == [("SW 501", 2), ("SW 502", 3)]
 
 if __name__ == "__main__":
-    pytest.main([__file__]) 
\ No newline at end of file
+    pytest.main([__file__]) 
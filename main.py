@@ -3,25 +3,28 @@ Dual-Degree Course & Requirement Planner
 Union Theological Seminary M.Div + Columbia MSSW
 """
 import streamlit as st
+import orjson
 import pandas as pd
 import os
 from typing import List, Dict
-import tempfile
+import io
 import re
-import uuid
+import html
+import zlib
+import atexit
+import threading
+import hashlib
+from pathlib import Path
 
-from models import Course, Requirement, Plan
-from parsers import parse_all_data
+from models import Course, Requirement, Plan, CourseTable
+from parsers import parse_all_data, SOURCE_PDFS, PARSER_VERSION, REQUIREMENT_KEYWORDS
 from utils import (
-    validate_requirements, 
-    calculate_total_credits, 
     export_plan_to_csv,
     get_courses_by_requirement,
-    get_courses_by_semester,
     format_time_slot,
     format_days,
     create_sample_data,
-    get_requirement_progress
+    compute_all
 )
 
 # Page configuration
@@ -32,196 +35,81 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Modern, elegant custom CSS for the app
-st.markdown("""
-<style>
-    body, .stApp {
-        background: #181c24 !important;
-        color: #f3f6fa !important;
-        font-family: 'Inter', 'Segoe UI', Arial, sans-serif;
-    }
-    .stSidebar {
-        background: #20232a !important;
-        border-right: 1px solid #23272f;
-    }
-    .st-emotion-cache-1v0mbdj, .st-emotion-cache-1v0mbdj:before {
-        background: #20232a !important;
-    }
-    .st-emotion-cache-1v0mbdj .st-emotion-cache-1v0mbdj {
-        background: #20232a !important;
-    }
-    .st-emotion-cache-1v0mbdj .st-emotion-cache-1v0mbdj .st-emotion-cache-1v0mbdj {
-        background: #20232a !important;
-    }
-    .st-emotion-cache-1v0mbdj .st-emotion-cache-1v0mbdj .st-emotion-cache-1v0mbdj .st-emotion-cache-1v0mbdj {
-        background: #20232a !important;
-    }
-    .course-card {
-        border: none;
-        border-radius: 18px;
-        padding: 24px 20px 18px 20px;
-        margin: 18px 0;
-        background: linear-gradient(135deg, #232a34 60%, #232a34 100%);
-        box-shadow: 0 2px 16px 0 rgba(0,0,0,0.12);
-        transition: box-shadow 0.2s;
-    }
-    .course-card:hover {
-        box-shadow: 0 4px 32px 0 rgba(0,0,0,0.22);
-        background: linear-gradient(135deg, #232a34 60%, #2a3140 100%);
-    }
-    .requirement-met {
-        color: #4ade80;
-        font-weight: 600;
-        letter-spacing: 0.5px;
-    }
-    .requirement-not-met {
-        color: #f87171;
-        font-weight: 600;
-        letter-spacing: 0.5px;
-    }
-    .stExpander > div > div > div > div {
-        background: #232a34 !important;
-        border-radius: 14px !important;
-        border: 1px solid #23272f !important;
-        margin-bottom: 8px;
-    }
-    .stTabs [data-baseweb="tab-list"] {
-        background: #20232a;
-        border-radius: 12px;
-        padding: 4px 8px;
-        margin-bottom: 18px;
-    }
-    .stTabs [data-baseweb="tab"] {
-        color: #b6c2e2;
-        font-weight: 500;
-        border-radius: 8px;
-        padding: 8px 18px;
-        margin: 0 2px;
-        transition: background 0.2s;
-    }
-    .stTabs [aria-selected="true"] {
-        background: #4f46e5 !important;
-        color: #fff !important;
-    }
-    .stButton > button {
-        background: linear-gradient(90deg, #6366f1 0%, #4f46e5 100%);
-        color: #fff;
-        border: none;
-        border-radius: 8px;
-        padding: 10px 22px;
-        font-weight: 600;
-        font-size: 1rem;
-        box-shadow: 0 2px 8px 0 rgba(79,70,229,0.08);
-        transition: background 0.2s, box-shadow 0.2s;
-        margin-bottom: 8px;
-    }
-    .stButton > button:hover {
-        background: linear-gradient(90deg, #818cf8 0%, #6366f1 100%);
-        box-shadow: 0 4px 16px 0 rgba(79,70,229,0.18);
-    }
-    .stMetric {
-        background: #232a34 !important;
-        border-radius: 10px;
-        padding: 10px 0 10px 16px;
-        margin-bottom: 10px;
-    }
-    .stTextInput > div > input, .stTextArea > div > textarea {
-        background: #232a34 !important;
-        color: #f3f6fa !important;
-        border-radius: 8px;
-        border: 1px solid #23272f;
-    }
-    .stSelectbox > div > div {
-        background: #232a34 !important;
-        color: #f3f6fa !important;
-        border-radius: 8px;
-        border: 1px solid #23272f;
-    }
-    .stCheckbox > label {
-        font-size: 1rem;
-        color: #b6c2e2;
-    }
-    .stSidebar .stCheckbox > label {
-        color: #f3f6fa;
-    }
-    .stSidebar .stMetric {
-        background: #232a34 !important;
-        color: #f3f6fa !important;
-    }
-    .stSidebar .stHeader {
-        color: #fff !important;
-    }
-    .stSidebar .stDivider {
-        border-color: #23272f !important;
-    }
-    .stSidebar .stSubheader {
-        color: #b6c2e2 !important;
-    }
-    .stSidebar .stTextInput > div > input {
-        background: #232a34 !important;
-        color: #f3f6fa !important;
-    }
-    .stSidebar .stSelectbox > div > div {
-        background: #232a34 !important;
-        color: #f3f6fa !important;
-    }
-    .stSidebar .stButton > button {
-        background: linear-gradient(90deg, #6366f1 0%, #4f46e5 100%);
-        color: #fff;
-        border: none;
-        border-radius: 8px;
-        padding: 8px 18px;
-        font-weight: 600;
-        font-size: 1rem;
-        box-shadow: 0 2px 8px 0 rgba(79,70,229,0.08);
-        transition: background 0.2s, box-shadow 0.2s;
-    }
-    .stSidebar .stButton > button:hover {
-        background: linear-gradient(90deg, #818cf8 0%, #6366f1 100%);
-        box-shadow: 0 4px 16px 0 rgba(79,70,229,0.18);
-    }
-    .stSidebar .stExpander > div > div > div > div {
-        background: #232a34 !important;
-        border-radius: 10px !important;
-        border: 1px solid #23272f !important;
-    }
-    .stSidebar .stSubheader {
-        color: #b6c2e2 !important;
-    }
-    .stSidebar .stHeader {
-        color: #fff !important;
-    }
-    .stSidebar .stTextInput > div > input {
-        background: #232a34 !important;
-        color: #f3f6fa !important;
-    }
-    .stSidebar .stSelectbox > div > div {
-        background: #232a34 !important;
-        color: #f3f6fa !important;
-    }
-    .stSidebar .stCheckbox > label {
-        color: #b6c2e2 !important;
-    }
-    .stSidebar .stMetric {
-        background: #232a34 !important;
-        color: #f3f6fa !important;
-    }
-    .stSidebar .stDivider {
-        border-color: #23272f !important;
-    }
-    .stSidebar .stExpander > div > div > div > div {
-        background: #232a34 !important;
-        border-radius: 10px !important;
-        border: 1px solid #23272f !important;
-    }
-    .stSidebar .stSubheader {
-        color: #b6c2e2 !important;
-    }
-    .stSidebar .stHeader {
-        color: #fff !important;
-    }
-</style>
-""", unsafe_allow_html=True)
+@st.cache_data
+def load_app_css() -> str:
+    """Read the app stylesheet once; reruns reuse the cached text"""
+    return (Path(__file__).parent / "static" / "app.css").read_text()
+
+
+# Modern, elegant custom CSS for the app (static/app.css)
+st.markdown(f"<style>{load_app_css()}</style>", unsafe_allow_html=True)
+
+
+PARSE_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+
+
+def _source_signature() -> str:
+    """Hash the path, size and mtime of every source PDF, plus the parser version and keywords"""
+    digest = hashlib.blake2b(digest_size=16)
+    # Cached courses carry their linked requirements, so parser or keyword edits invalidate them
+    digest.update(repr((PARSER_VERSION, sorted(REQUIREMENT_KEYWORDS.items()))).encode())
+    for filepath in SOURCE_PDFS:
+        try:
+            stat = os.stat(filepath)
+        except FileNotFoundError:
+            digest.update(f"{filepath}\0missing\n".encode())
+        else:
+            digest.update(f"{filepath}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def _load_parse_cache(signature: str):
+    cache_path = Path(PARSE_CACHE_DIR, f"parsed-{signature}.json")
+    if not cache_path.exists():
+        return None
+    try:
+        data = orjson.loads(cache_path.read_bytes())
+        courses = [Course.from_dict(course) for course in data['courses']]
+        requirements = [Requirement.from_dict(req) for req in data['requirements']]
+    except Exception as e:
+        print(f"Warning: ignoring unreadable parse cache {cache_path.name}: {e}")
+        return None
+    return courses, requirements
+
+
+def _save_parse_cache(signature: str, courses: List[Course], requirements: List[Requirement]):
+    os.makedirs(PARSE_CACHE_DIR, exist_ok=True)
+    cache_name = f"parsed-{signature}.json"
+    cache_path = os.path.join(PARSE_CACHE_DIR, cache_name)
+    # Per-process temp name: concurrent Streamlit sessions may write the same cache entry
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    data = {
+        'courses': [course.to_dict() for course in courses],
+        'requirements': [req.to_dict() for req in requirements],
+    }
+    with open(tmp_path, "wb") as f:
+        f.write(orjson.dumps(data))
+    os.replace(tmp_path, cache_path)
+    # Entries for older versions of the PDFs can never be hit again
+    with os.scandir(PARSE_CACHE_DIR) as entries:
+        for entry in entries:
+            if entry.name.startswith("parsed-") and entry.name.endswith(".json") and entry.name != cache_name:
+                try:
+                    os.remove(entry.path)
+                except FileNotFoundError:
+                    pass
+
+
+def parse_all_data_cached():
+    """parse_all_data(), reusing the last parse from disk if no source PDF changed"""
+    signature = _source_signature()
+    cached = _load_parse_cache(signature)
+    if cached is not None:
+        return cached
+    courses, requirements = parse_all_data()
+    if courses and requirements:
+        _save_parse_cache(signature, courses, requirements)
+    return courses, requirements
 
 
 @st.cache_data
@@ -229,7 +117,7 @@ def load_data():
     """Load course and requirement data with caching"""
     try:
         # Try to parse PDF files
-        courses, requirements = parse_all_data()
+        courses, requirements = parse_all_data_cached()
         if not courses or not requirements:
             st.warning("PDF parsing returned no data. Using sample data instead.")
             courses, requirements = create_sample_data()
@@ -241,27 +129,123 @@ def load_data():
     return courses, requirements
 
 
+@st.cache_resource
+def load_course_table() -> CourseTable:
+    """Column-oriented copy of the loaded courses for filtering, built once per process"""
+    courses, _ = load_data()
+    return CourseTable.from_courses(courses)
+
+
+PLAN_FILE = os.path.expanduser("~/dual_degree_plan.json")
+PLAN_SAVE_DELAY_SECONDS = 2.0
+
+
+class DirtyPlanWriter:
+    """Write-behind plan saver: coalesces saves into one disk write after a short quiet period"""
+    
+    def __init__(self, filepath: str, delay: float = PLAN_SAVE_DELAY_SECONDS):
+        self.filepath = filepath
+        self.delay = delay
+        self._plan = None
+        self._timer = None
+        self._lock = threading.Lock()
+    
+    def mark_dirty(self, plan: Plan):
+        """Schedule the plan to be written; repeated calls before the flush share one write"""
+        with self._lock:
+            self._plan = plan
+            if self._timer is None:
+                self._timer = threading.Timer(self.delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+    
+    def pending_plan(self):
+        """The plan waiting to be written, if any"""
+        with self._lock:
+            return self._plan
+    
+    def flush(self):
+        """Write the pending plan now"""
+        with self._lock:
+            plan, self._plan = self._plan, None
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        if plan is not None:
+            plan.save_to_file(self.filepath)
+
+
+def _plan_selection_key(plan: Plan):
+    """Hashable snapshot of a plan's selections, used as a cache key"""
+    return tuple(sorted((semester, tuple(course_ids)) for semester, course_ids in plan.selections.items()))
+
+
+@st.cache_data(hash_funcs={Plan: _plan_selection_key})
+def cached_plan_summary(plan: Plan, _courses: List[Course], _requirements: List[Requirement]) -> Dict:
+    """Credits, validation and progress from one scan of the plan, recomputed only when its selections change
+    
+    Courses and requirements come from the cached load_data(), so they are left
+    out of the cache key.
+    """
+    return compute_all(plan, _courses, _requirements)
+
+
+def cached_requirement_progress(plan: Plan, courses: List[Course], requirements: List[Requirement]) -> Dict:
+    """Requirement progress for the plan"""
+    return cached_plan_summary(plan, courses, requirements)['progress']
+
+
+@st.cache_data(hash_funcs={Plan: _plan_selection_key})
+def cached_requirement_details_html(plan: Plan, _courses: List[Course], _requirements: List[Requirement]) -> str:
+    """HTML for every requirement's status card, joined into one block"""
+    validation = cached_requirement_progress(plan, _courses, _requirements)['validation_results']
+    chunks = [
+        f'<div class="course-card">'
+        f'<h4>{result["requirement"].label}</h4>'
+        f'<p><span class="{"requirement-met" if result["is_met"] else "requirement-not-met"}">{result["status"]}</span></p>'
+        f'<p><strong>Credits:</strong> {result["total_credits"]:.1f} / {result["min_credits"]:.1f}</p>'
+        f'<p><strong>Selected Courses:</strong> {len(result["selected_courses"])}</p>'
+        f'</div>'
+        for result in validation.values()
+    ]
+    return "\n".join(chunks)
+
+
+def cached_total_credits(plan: Plan, courses: List[Course], requirements: List[Requirement]) -> float:
+    """Total planned credits"""
+    return cached_plan_summary(plan, courses, requirements)['total_credits']
+
+
+@st.cache_resource
+def get_plan_writer() -> DirtyPlanWriter:
+    """One writer per server process, shared across reruns and sessions"""
+    writer = DirtyPlanWriter(PLAN_FILE)
+    atexit.register(writer.flush)
+    return writer
+
+
 def load_user_plan() -> Plan:
-    """Load user's saved plan or create new one"""
-    plan_file = os.path.expanduser("~/dual_degree_plan.json")
-    return Plan.load_from_file(plan_file)
+    """Load user's saved plan or create new one (read from disk once per session)"""
+    if "plan" not in st.session_state:
+        st.session_state["plan"] = get_plan_writer().pending_plan() or Plan.load_from_file(PLAN_FILE)
+    return st.session_state["plan"]
 
 
 def save_user_plan(plan: Plan):
-    """Save user's plan"""
-    plan_file = os.path.expanduser("~/dual_degree_plan.json")
-    plan.save_to_file(plan_file)
+    """Save user's plan (written to disk in the background)"""
+    st.session_state["plan"] = plan
+    get_plan_writer().mark_dirty(plan)
 
 
-def render_course_card(course: Course, plan: Plan, courses: List[Course], tab_context: str = ""):
+def render_course_card(course: Course, plan: Plan, tab_context: str = "", selected_ids=None):
     """Render a course as an expandable card"""
-    course_lookup = {c.id: c for c in courses}
-    
-    # Guarantee a unique context suffix for Streamlit widget keys
-    unique_context = tab_context if tab_context else uuid.uuid4().hex[:8]
+    # Widget keys must be unique and stable across reruns so Streamlit keeps widget state
+    unique_context = tab_context if tab_context else f"{zlib.crc32(course.id.encode()):08x}"
     
     # Check if course is in plan
-    is_selected = any(course.id in semester_courses for semester_courses in plan.selections.values())
+    if selected_ids is None:
+        selected_ids = {cid for semester_courses in plan.selections.values() for cid in semester_courses}
+    is_selected = course.id in selected_ids
     
     with st.expander(f"**{course.code}** - {course.title}", expanded=False):
         col1, col2 = st.columns([2, 1])
@@ -301,12 +285,28 @@ def render_course_card(course: Course, plan: Plan, courses: List[Course], tab_co
                     st.rerun()
 
 
+def render_course_card_html(course: Course, is_selected: bool) -> str:
+    """Render a read-only course card as HTML (no widgets)"""
+    satisfies = f"<p><strong>Satisfies:</strong> {html.escape(', '.join(sorted(course.satisfies)))}</p>" if course.satisfies else ""
+    in_plan = ' <span class="requirement-met">✅ In plan</span>' if is_selected else ""
+    return (
+        f'<div class="course-card">'
+        f'<h4>{html.escape(course.code)} - {html.escape(course.title)}{in_plan}</h4>'
+        f'<p><strong>Faculty:</strong> {html.escape(course.faculty)} · '
+        f'<strong>Credits:</strong> {course.credits} · '
+        f'<strong>Schedule:</strong> {html.escape(format_days(course.days))} {html.escape(format_time_slot(course.time))} · '
+        f'<strong>Semester:</strong> {html.escape(course.semester)}</p>'
+        f'{satisfies}'
+        f'</div>'
+    )
+
+
 def render_requirement_sidebar(requirements: List[Requirement], plan: Plan, courses: List[Course]):
     """Render requirement filter sidebar"""
     st.sidebar.header("📋 Degree Requirements")
     
     # Get progress
-    progress = get_requirement_progress(plan, courses, requirements)
+    progress = cached_requirement_progress(plan, courses, requirements)
     
     # Overall progress
     st.sidebar.metric(
@@ -338,14 +338,13 @@ def render_plan_summary(plan: Plan, courses: List[Course], requirements: List[Re
     st.header("📊 Plan Summary")
     
     # Get validation results
-    validation = validate_requirements(plan, courses, requirements)
-    progress = get_requirement_progress(plan, courses, requirements)
+    progress = cached_requirement_progress(plan, courses, requirements)
     
     # Overall stats
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        total_credits = calculate_total_credits(plan, courses)
+        total_credits = cached_total_credits(plan, courses, requirements)
         st.metric("Total Credits", f"{total_credits:.1f}")
     
     with col2:
@@ -360,18 +359,7 @@ def render_plan_summary(plan: Plan, courses: List[Course], requirements: List[Re
     
     # Detailed validation
     with st.expander("📋 Requirement Details", expanded=True):
-        for req_id, result in validation.items():
-            requirement = result['requirement']
-            status_class = "requirement-met" if result['is_met'] else "requirement-not-met"
-            
-            st.markdown(f"""
-            <div class="course-card">
-                <h4>{requirement.label}</h4>
-                <p><span class="{status_class}">{result['status']}</span></p>
-                <p><strong>Credits:</strong> {result['total_credits']:.1f} / {requirement.min_credits:.1f}</p>
-                <p><strong>Selected Courses:</strong> {len(result['selected_courses'])}</p>
-            </div>
-            """, unsafe_allow_html=True)
+        st.markdown(cached_requirement_details_html(plan, courses, requirements), unsafe_allow_html=True)
 
 
 def main():
@@ -384,6 +372,7 @@ def main():
     
     # Load user plan
     plan = load_user_plan()
+    selected_ids = {cid for semester_courses in plan.selections.values() for cid in semester_courses}
     
     # Sidebar with requirements filter
     selected_requirements = render_requirement_sidebar(requirements, plan, courses)
@@ -392,34 +381,30 @@ def main():
     tab1, tab2, tab3 = st.tabs(["📅 Fall 2025", "📅 Spring 2026", "📚 All Courses"])
     
     # Filter courses based on selected requirements
-    filtered_courses = courses
-    if selected_requirements:
-        filtered_courses = []
-        for course in courses:
-            if any(req_id in course.satisfies for req_id in selected_requirements):
-                filtered_courses.append(course)
+    course_table = load_course_table()
+    requirement_mask = course_table.requirement_mask(selected_requirements) if selected_requirements else course_table.all()
     
     # Fall 2025 Tab
     with tab1:
         st.header("Fall 2025 Course Schedule")
-        fall_courses = get_courses_by_semester(filtered_courses, "Fall 2025")
+        fall_courses = course_table.select(requirement_mask & course_table.semester_mask("Fall 2025"))
         
         if not fall_courses:
             st.info("No courses found for Fall 2025.")
         else:
             for idx, course in enumerate(fall_courses):
-                render_course_card(course, plan, courses, tab_context=f"fall2025_{idx}")
+                render_course_card(course, plan, tab_context=f"fall2025_{idx}", selected_ids=selected_ids)
     
     # Spring 2026 Tab
     with tab2:
         st.header("Spring 2026 Course Schedule")
-        spring_courses = get_courses_by_semester(filtered_courses, "Spring 2026")
+        spring_courses = course_table.select(requirement_mask & course_table.semester_mask("Spring 2026"))
         
         if not spring_courses:
             st.info("No courses found for Spring 2026.")
         else:
             for idx, course in enumerate(spring_courses):
-                render_course_card(course, plan, courses, tab_context=f"spring2026_{idx}")
+                render_course_card(course, plan, tab_context=f"spring2026_{idx}", selected_ids=selected_ids)
     
     # All Courses Tab
     with tab3:
@@ -433,27 +418,36 @@ def main():
             credit_filter = st.selectbox("Filter by credits:", ["All", "1-2", "3", "4+"])
         
         # Apply filters
-        display_courses = filtered_courses
+        display_mask = requirement_mask.copy()
         if search_term:
-            search_term = search_term.upper()
-            display_courses = [
-                course for course in display_courses
-                if search_term in course.code.upper() or search_term in course.title.upper()
-            ]
+            display_mask &= course_table.search_mask(search_term)
         
         if credit_filter != "All":
             if credit_filter == "1-2":
-                display_courses = [course for course in display_courses if 1 <= course.credits <= 2]
+                display_mask &= course_table.credit_mask(1, 2)
             elif credit_filter == "3":
-                display_courses = [course for course in display_courses if course.credits == 3]
+                display_mask &= course_table.credit_mask(3, 3)
             elif credit_filter == "4+":
-                display_courses = [course for course in display_courses if course.credits >= 4]
+                display_mask &= course_table.credit_mask(4)
+        display_courses = course_table.select(display_mask)
         
         if not display_courses:
             st.info("No courses match the current filters.")
         else:
-            for idx, course in enumerate(display_courses):
-                render_course_card(course, plan, courses, tab_context=f"all_{idx}")
+            # One widget-free HTML blob for the listing; widgets only for the chosen course
+            st.markdown(
+                "\n".join(render_course_card_html(course, course.id in selected_ids) for course in display_courses),
+                unsafe_allow_html=True
+            )
+            
+            selected_course = st.selectbox(
+                "Select a course to add or remove:",
+                display_courses,
+                format_func=lambda course: f"{course.code} - {course.title} ({course.semester})",
+                key="all_courses_details"
+            )
+            if selected_course is not None:
+                render_course_card(selected_course, plan, tab_context="all_details", selected_ids=selected_ids)
     
     # Plan summary and actions
     st.divider()
@@ -465,29 +459,23 @@ def main():
     with col1:
         if st.button("💾 Save Plan"):
             save_user_plan(plan)
+            get_plan_writer().flush()
             st.success("Plan saved successfully!")
     
     with col2:
         if st.button("📥 Download CSV"):
             try:
-                # Create temporary file
-                with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as tmp_file:
-                    export_plan_to_csv(plan, courses, tmp_file.name)
-                    
-                    # Read the file and provide download
-                    with open(tmp_file.name, 'r') as f:
-                        csv_data = f.read()
-                    
-                    st.download_button(
-                        label="Click to download",
-                        data=csv_data,
-                        file_name="dual_degree_plan.csv",
-                        mime="text/csv"
-                    )
-                    
-                    # Clean up
-                    os.unlink(tmp_file.name)
-                    
+                # Build the CSV in memory and provide download
+                buffer = io.StringIO()
+                export_plan_to_csv(plan, courses, buffer)
+                
+                st.download_button(
+                    label="Click to download",
+                    data=buffer.getvalue(),
+                    file_name="dual_degree_plan.csv",
+                    mime="text/csv"
+                )
+                
             except Exception as e:
                 st.error(f"Error exporting CSV: {e}")
     
@@ -2,12 +2,19 @@
 Data models for the Dual-Degree Course Planner
 """
 from dataclasses import dataclass, field
-from typing import List, Dict, Set, Optional
+from typing import List, Dict, Set, FrozenSet, Optional
 from datetime import datetime
-import json
+from pathlib import Path
+import hashlib
+import os
+import sys
+import threading
 
+import numpy as np
+import orjson
 
-@dataclass
+
+@dataclass(slots=True)
 class Requirement:
     """Represents a degree requirement that courses can satisfy"""
     id: str
@@ -28,16 +35,16 @@ class Requirement:
     def from_dict(cls, data: Dict) -> 'Requirement':
         """Create from dictionary"""
         return cls(
-            id=data['id'],
+            id=sys.intern(data['id']),
             label=data['label'],
             min_credits=data['min_credits'],
             satisfied_by=set(data.get('satisfied_by', []))
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Course:
-    """Represents a course offering"""
+    """Represents a course offering (immutable, so courses can be hashed and shared)"""
     id: str
     code: str
     title: str
@@ -48,7 +55,14 @@ class Course:
     semester: str
     delivery_mode: str
     description: str
-    satisfies: Set[str] = field(default_factory=set)  # Set of Requirement IDs
+    satisfies: FrozenSet[str] = frozenset()  # Set of Requirement IDs
+    # "CODE TITLE" uppercased once at construction, for keyword matching
+    search_text: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        if not isinstance(self.satisfies, frozenset):
+            object.__setattr__(self, 'satisfies', frozenset(self.satisfies))
+        object.__setattr__(self, 'search_text', f"{self.code} {self.title}".upper())
     
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization"""
@@ -80,7 +94,8 @@ class Course:
             semester=data['semester'],
             delivery_mode=data['delivery_mode'],
             description=data['description'],
-            satisfies=set(data.get('satisfies', []))
+            # Requirement ids are interned so membership checks can short-circuit on identity
+            satisfies=frozenset(map(sys.intern, data.get('satisfies', [])))
         )
 
 
@@ -91,6 +106,8 @@ class Plan:
     notes: str = ""
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
+    # (filepath, digest) of the last write, so unchanged plans aren't rewritten
+    _last_write: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
     
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization"""
@@ -117,29 +134,116 @@ class Plan:
             self.selections[semester] = []
         if course_id not in self.selections[semester]:
             self.selections[semester].append(course_id)
-            self.updated_at = datetime.now()
     
     def remove_course(self, semester: str, course_id: str):
         """Remove a course from the plan"""
         if semester in self.selections and course_id in self.selections[semester]:
             self.selections[semester].remove(course_id)
-            self.updated_at = datetime.now()
     
     def get_courses_for_semester(self, semester: str) -> List[str]:
         """Get all course IDs for a given semester"""
         return self.selections.get(semester, [])
     
     def save_to_file(self, filepath: str):
-        """Save plan to JSON file"""
-        with open(filepath, 'w') as f:
-            json.dump(self.to_dict(), f, indent=2)
+        """Save plan to JSON file, stamping updated_at
+        
+        Skipped if the plan's contents haven't changed since it was last written there.
+        """
+        content = self.to_dict()
+        del content['updated_at']
+        last_write = (filepath, hashlib.blake2b(orjson.dumps(content)).digest())
+        if last_write == self._last_write and os.path.exists(filepath):
+            return
+        self.updated_at = datetime.now()
+        data = orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2)
+        # Per-writer temp name: the DirtyPlanWriter timer thread and the main thread may flush at once
+        tmp_path = f"{filepath}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, filepath)
+        self._last_write = last_write
     
     @classmethod
     def load_from_file(cls, filepath: str) -> 'Plan':
         """Load plan from JSON file"""
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+            data = orjson.loads(Path(filepath).read_bytes())
             return cls.from_dict(data)
         except FileNotFoundError:
-            return cls()  # Return empty plan if file doesn't exist 
\ No newline at end of file
+            return cls()  # Return empty plan if file doesn't exist 
+
+
+@dataclass(frozen=True, eq=False)
+class CourseTable:
+    """Column-oriented view of a course list for vectorized filtering
+    
+    Row i of every array describes courses[i]; filters return boolean masks
+    that can be combined with & and | before selecting rows.
+    """
+    courses: tuple
+    credits: np.ndarray  # float credits per course
+    semester_ids: np.ndarray  # index into semesters per course
+    semesters: tuple
+    satisfies: np.ndarray  # bool matrix, courses x requirement_ids
+    requirement_ids: tuple
+    
+    @classmethod
+    def from_courses(cls, courses: List[Course]) -> 'CourseTable':
+        """Build the columns from a list of courses"""
+        semesters = tuple(dict.fromkeys(course.semester for course in courses))
+        semester_index = {semester: i for i, semester in enumerate(semesters)}
+        requirement_ids = tuple(sorted({req_id for course in courses for req_id in course.satisfies}))
+        requirement_index = {req_id: i for i, req_id in enumerate(requirement_ids)}
+        
+        satisfies = np.zeros((len(courses), len(requirement_ids)), dtype=bool)
+        for row, course in enumerate(courses):
+            for req_id in course.satisfies:
+                satisfies[row, requirement_index[req_id]] = True
+        
+        return cls(
+            courses=tuple(courses),
+            credits=np.fromiter((course.credits for course in courses), dtype=float, count=len(courses)),
+            semester_ids=np.fromiter((semester_index[course.semester] for course in courses), dtype=np.int16, count=len(courses)),
+            semesters=semesters,
+            satisfies=satisfies,
+            requirement_ids=requirement_ids,
+        )
+    
+    def all(self) -> np.ndarray:
+        """Mask selecting every course"""
+        return np.ones(len(self.courses), dtype=bool)
+    
+    def semester_mask(self, semester: str) -> np.ndarray:
+        """Mask of courses offered in the given semester"""
+        if semester not in self.semesters:
+            return np.zeros(len(self.courses), dtype=bool)
+        return self.semester_ids == self.semesters.index(semester)
+    
+    def requirement_mask(self, requirement_ids: List[str]) -> np.ndarray:
+        """Mask of courses satisfying any of the given requirements"""
+        columns = [self.requirement_ids.index(req_id) for req_id in requirement_ids if req_id in self.requirement_ids]
+        if not columns:
+            return np.zeros(len(self.courses), dtype=bool)
+        return self.satisfies[:, columns].any(axis=1)
+    
+    def credit_mask(self, min_credits: float = None, max_credits: float = None) -> np.ndarray:
+        """Mask of courses whose credits fall within the inclusive bounds"""
+        mask = self.all()
+        if min_credits is not None:
+            mask &= self.credits >= min_credits
+        if max_credits is not None:
+            mask &= self.credits <= max_credits
+        return mask
+    
+    def search_mask(self, term: str) -> np.ndarray:
+        """Mask of courses whose code or title contains the term (case-insensitive)
+        
+        Searches each course's search_text, the same key requirement linking matches against.
+        """
+        term = term.upper()
+        return np.fromiter((term in course.search_text for course in self.courses), dtype=bool, count=len(self.courses))
+    
+    def select(self, mask: np.ndarray) -> List[Course]:
+        """The courses selected by a mask, in their original order"""
+        return [self.courses[row] for row in np.flatnonzero(mask)]
+
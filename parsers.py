@@ -2,110 +2,311 @@
 PDF parsers for extracting course and requirement data from Union Theological Seminary documents
 """
 import pdfplumber
+import pypdfium2 as pdfium
+import orjson
 import re
-from typing import List, Dict, Tuple, Optional
+import io
+import os
+import hashlib
+import functools
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from contextlib import contextmanager
+from dataclasses import replace
+from itertools import chain
+from typing import ClassVar, List, Dict, Tuple, Optional, Iterable, Iterator
 from models import Course, Requirement
 import logging
 
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional – linking falls back to compiled regexes
+    ahocorasick = None  # type: ignore
+
+try:
+    import pdftotext
+except ImportError:  # pdftotext (Poppler) is optional – only used when USE_PDFTOTEXT is set
+    pdftotext = None  # type: ignore
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+PARSE_CACHE_DIR = os.getenv("PARSE_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "degree-planner"))
+# Bump whenever parsing output changes, so results cached by older versions are not reused
+PARSER_VERSION = 1
+# Opt in to Poppler's pdftotext for page text; pdfium is used otherwise
+USE_PDFTOTEXT = os.getenv("USE_PDFTOTEXT", "").lower() in ("1", "true", "yes")
+
+
+def _pdf_cache_path(kind: str, pdf_bytes: bytes, args: tuple) -> Path:
+    digest = hashlib.blake2b(pdf_bytes, digest_size=16)
+    digest.update(repr((PARSER_VERSION, args)).encode())
+    # Text backends lay pages out differently, so they don't share results
+    digest.update(b"pdftotext" if USE_PDFTOTEXT and pdftotext is not None else b"pdfium")
+    return Path(PARSE_CACHE_DIR, f"{kind}-{digest.hexdigest()}.json")
+
+
+def _load_pdf_cache(cache_path: Path, from_dict) -> Optional[list]:
+    if not cache_path.exists():
+        return None
+    try:
+        return [from_dict(item) for item in orjson.loads(cache_path.read_bytes())]
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable parse cache {cache_path.name}: {e}")
+        return None
+
+
+def _cache_pdf_result(kind: str, from_dict):
+    """Cache a parser method's results on disk, keyed by the PDF's content hash
+    
+    The wrapped method is called with the file's bytes (pdf_bytes=...) on a miss,
+    so the PDF is only read once. Empty results are not cached, since the parsers
+    return [] on errors too. method.cached(filepath, *args) returns the cached
+    results, or None on a miss, without parsing.
+    """
+    def decorator(method):
+        def cached(filepath: str, *args) -> Optional[list]:
+            try:
+                pdf_bytes = Path(filepath).read_bytes()
+            except OSError:
+                return None
+            return _load_pdf_cache(_pdf_cache_path(kind, pdf_bytes, args), from_dict)
+        
+        @functools.wraps(method)
+        def wrapper(self, filepath: str, *args):
+            try:
+                pdf_bytes = Path(filepath).read_bytes()
+            except OSError:
+                return method(self, filepath, *args)  # Let the parser log the failure
+            
+            cache_path = _pdf_cache_path(kind, pdf_bytes, args)
+            results = _load_pdf_cache(cache_path, from_dict)
+            if results is not None:
+                return results
+            
+            results = method(self, filepath, *args, pdf_bytes=pdf_bytes)
+            if results:
+                # The cache is best-effort; a read-only or full disk must not fail the parse
+                try:
+                    os.makedirs(PARSE_CACHE_DIR, exist_ok=True)
+                    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+                    with open(tmp_path, 'wb') as f:
+                        f.write(orjson.dumps([item.to_dict() for item in results]))
+                    os.replace(tmp_path, cache_path)
+                except OSError as e:
+                    logger.warning(f"Could not write parse cache {cache_path.name}: {e}")
+            return results
+        
+        wrapper.cached = cached
+        return wrapper
+    return decorator
+
+
+# Line-oriented course schedule parsing: a course starts on a line beginning with its code
+_COURSE_CODE_RE = re.compile(r'([A-Z]{2,4}\s+\d{3,4}[A-Z]?)\b')
+# Credits, days and time appear together mid-line and split it into its halves
+_SCHEDULE_RE = re.compile(r'(?:^|\s)(\d+(?:\.\d+)?)\s+([MTWRF]+)\s+([0-9:]+-[0-9:]+(?:AM|PM)?)(?=\s|$)')
+_COLUMN_GAP_RE = re.compile(r'\s{2,}')
+_FACULTY_RE = re.compile(r'\s((?:Dr|Prof|Rev)\.?\s.*)$')
+_DELIVERY_RE = re.compile(r'(In[- ]Person|Hybrid|Online|Remote)\b', re.IGNORECASE)
+DESCRIPTION_MAX_CHARS = 200
+
+
+@contextmanager
+def _open_page_text(source):
+    """Open a PDF (path or bytes) and yield an iterator over its pages' text
+    
+    Text comes from pdfium, which skips pdfplumber's per-character layout objects;
+    if pdfium finds no text at all, the pages are re-read with pdfplumber instead.
+    With USE_PDFTOTEXT set (and the pdftotext binding installed), Poppler's
+    layout-preserving text is used first.
+    """
+    if USE_PDFTOTEXT and pdftotext is not None:
+        with (io.BytesIO(source) if isinstance(source, bytes) else open(source, 'rb')) as f:
+            pages = list(pdftotext.PDF(f, physical=True))
+        if any(text.strip() for text in pages):
+            yield iter(pages)
+            return
+    
+    pdf = pdfium.PdfDocument(source)
+    try:
+        yield _iter_page_text(pdf, source)
+    finally:
+        pdf.close()
+
+
+def _iter_page_text(pdf, source) -> Iterator[str]:
+    # Leading empty pages are held back until we know pdfium can read this file
+    pending = []
+    found_text = False
+    for page in pdf:
+        textpage = page.get_textpage()
+        text = textpage.get_text_range()
+        textpage.close()
+        page.close()
+        if found_text:
+            yield text
+        elif text.strip():
+            found_text = True
+            yield from pending
+            yield text
+        else:
+            pending.append(text)
+    
+    if not found_text:
+        with pdfplumber.open(io.BytesIO(source) if isinstance(source, bytes) else source) as plumber_pdf:
+            for page in plumber_pdf.pages:
+                text = page.extract_text() or ""
+                # Release the page's cached layout objects once it's read
+                page.close()
+                yield text
+
 
 class CourseScheduleParser:
     """Parser for course schedule PDFs"""
     
-    def __init__(self):
-        self.course_pattern = re.compile(
-            r'([A-Z]{2,4}\s+\d{3,4}[A-Z]?)\s*'  # Course code
-            r'([^0-9\n]+?)\s*'  # Title
-            r'([A-Za-z\s,\.]+?)\s*'  # Faculty
-            r'(\d+(?:\.\d+)?)\s*'  # Credits
-            r'([MTWRF]+)\s*'  # Days
-            r'([0-9:]+-[0-9:]+(?:AM|PM)?)\s*'  # Time
-            r'([A-Za-z\s]+?)\s*'  # Delivery mode
-            r'([^0-9\n]{20,100})',  # Description
-            re.MULTILINE | re.DOTALL
-        )
-    
-    def parse_schedule_pdf(self, filepath: str, semester: str) -> List[Course]:
+    @_cache_pdf_result('schedule', Course.from_dict)
+    def parse_schedule_pdf(self, filepath: str, semester: str, pdf_bytes: Optional[bytes] = None) -> List[Course]:
         """Parse a course schedule PDF and extract course information"""
         courses = []
         
         try:
-            with pdfplumber.open(filepath) as pdf:
-                text = ""
-                for page in pdf.pages:
-                    text += page.extract_text() + "\n"
+            with _open_page_text(pdf_bytes if pdf_bytes is not None else filepath) as pages:
+                # Lines are consumed page by page; only one page's text is alive at a time
+                first_page = next(pages, "")
                 # Debug: print first 500 characters of extracted text
-                logger.info(f"[DEBUG] First 500 chars from {filepath}:\n{text[:500]}")
-                
-                # Find course entries
-                matches = self.course_pattern.finditer(text)
+                logger.info(f"[DEBUG] First 500 chars from {filepath}:\n{first_page[:500]}")
                 
-                for match in matches:
-                    try:
-                        code = match.group(1).strip()
-                        title = match.group(2).strip()
-                        faculty = match.group(3).strip()
-                        credits = float(match.group(4))
-                        days = match.group(5).strip()
-                        time = match.group(6).strip()
-                        delivery_mode = match.group(7).strip()
-                        description = match.group(8).strip()[:200]  # Limit description length
-                        
-                        # Create unique ID
-                        course_id = f"{code}_{semester}_{faculty.split()[0]}"
-                        
-                        course = Course(
-                            id=course_id,
-                            code=code,
-                            title=title,
-                            faculty=faculty,
-                            credits=credits,
-                            days=days,
-                            time=time,
-                            semester=semester,
-                            delivery_mode=delivery_mode,
-                            description=description
-                        )
-                        
-                        courses.append(course)
-                        
-                    except (IndexError, ValueError) as e:
-                        logger.warning(f"Failed to parse course match: {e}")
-                        continue
+                lines = chain.from_iterable(page_text.splitlines() for page_text in chain([first_page], pages))
+                courses = self.parse_schedule_lines(lines, semester)
                         
         except Exception as e:
             logger.error(f"Error parsing PDF {filepath}: {e}")
             
         return courses
+    
+    def parse_schedule_text(self, text: str, semester: str) -> List[Course]:
+        """Parse course entries out of schedule text, one course per code-prefixed line
+        
+        Lines that don't start with a course code continue the previous course's description.
+        """
+        return self.parse_schedule_lines(text.splitlines(), semester)
+    
+    def parse_schedule_lines(self, lines: Iterable[str], semester: str) -> List[Course]:
+        """Parse course entries from an iterable of schedule text lines"""
+        entries = []
+        current = None
+        
+        for raw_line in lines:
+            line = raw_line.strip()
+            if not line:
+                continue
+            
+            code_match = _COURSE_CODE_RE.match(line)
+            if not code_match:
+                if current is not None:
+                    current['description'].append(line)
+                continue
+            
+            current = self._parse_course_line(line, code_match)
+            if current is not None:
+                entries.append(current)
+        
+        courses = []
+        for entry in entries:
+            try:
+                description = " ".join(entry['description'])[:DESCRIPTION_MAX_CHARS]  # Limit description length
+                
+                # Create unique ID
+                # Lines without a recognisable faculty column still get an id
+                course_id = f"{entry['code']}_{semester}_{(entry['faculty'].split() or ['TBA'])[0]}"
+                
+                course = Course(
+                    id=course_id,
+                    code=entry['code'],
+                    title=entry['title'],
+                    faculty=entry['faculty'],
+                    credits=entry['credits'],
+                    days=entry['days'],
+                    time=entry['time'],
+                    semester=semester,
+                    delivery_mode=entry['delivery_mode'],
+                    description=description
+                )
+                
+                courses.append(course)
+                
+            except (IndexError, ValueError) as e:
+                logger.warning(f"Failed to parse course entry {entry['code']}: {e}")
+                continue
+        
+        return courses
+    
+    @staticmethod
+    def _parse_course_line(line: str, code_match) -> Optional[Dict]:
+        """Split one course line into fields, or None if it has no credits/days/time"""
+        schedule_match = _SCHEDULE_RE.search(line, code_match.end())
+        if not schedule_match:
+            return None
+        
+        # Title and faculty come before the schedule columns
+        head = line[code_match.end():schedule_match.start()].strip()
+        parts = _COLUMN_GAP_RE.split(head)
+        if len(parts) > 1:
+            title, faculty = parts[0], " ".join(parts[1:])
+        else:
+            faculty_match = _FACULTY_RE.search(head)
+            if faculty_match:
+                title, faculty = head[:faculty_match.start()].strip(), faculty_match.group(1).strip()
+            else:
+                title, faculty = head, ""
+        
+        # Delivery mode and the start of the description come after them
+        tail = line[schedule_match.end():].strip()
+        delivery_match = _DELIVERY_RE.match(tail)
+        if delivery_match:
+            delivery_mode, description = delivery_match.group(1), tail[delivery_match.end():].strip()
+        else:
+            tail_parts = _COLUMN_GAP_RE.split(tail, 1)
+            delivery_mode = tail_parts[0]
+            description = tail_parts[1] if len(tail_parts) > 1 else ""
+        
+        return {
+            'code': code_match.group(1),
+            'title': title,
+            'faculty': faculty,
+            'credits': float(schedule_match.group(1)),
+            'days': schedule_match.group(2),
+            'time': schedule_match.group(3),
+            'delivery_mode': delivery_mode,
+            'description': [description] if description else [],
+        }
 
 
 class MDivRequirementParser:
     """Parser for MDiv program requirements"""
     
-    def __init__(self):
-        self.requirement_patterns = {
-            'bible': re.compile(r'Bible|Sacred\s+Texts?', re.IGNORECASE),
-            'historical': re.compile(r'Historical\s+Studies?', re.IGNORECASE),
-            'interreligious': re.compile(r'Interreligious\s+Engagement', re.IGNORECASE),
-            'practical': re.compile(r'Practical\s+Theology', re.IGNORECASE),
-            'theology_ethics': re.compile(r'Theology\s+&\s+Ethics|Theology\s+and\s+Ethics', re.IGNORECASE),
-            'field_ed': re.compile(r'Field\s+Education|Field\s+Ed', re.IGNORECASE),
-            'electives': re.compile(r'Electives?', re.IGNORECASE)
-        }
-        
-        self.credit_pattern = re.compile(r'(\d+(?:\.\d+)?)\s*(?:credit|credits)', re.IGNORECASE)
+    # Compiled once per process rather than per parser instance
+    requirement_patterns: ClassVar[Dict[str, re.Pattern]] = {
+        'bible': re.compile(r'Bible|Sacred\s+Texts?', re.IGNORECASE),
+        'historical': re.compile(r'Historical\s+Studies?', re.IGNORECASE),
+        'interreligious': re.compile(r'Interreligious\s+Engagement', re.IGNORECASE),
+        'practical': re.compile(r'Practical\s+Theology', re.IGNORECASE),
+        'theology_ethics': re.compile(r'Theology\s+&\s+Ethics|Theology\s+and\s+Ethics', re.IGNORECASE),
+        'field_ed': re.compile(r'Field\s+Education|Field\s+Ed', re.IGNORECASE),
+        'electives': re.compile(r'Electives?', re.IGNORECASE)
+    }
+    
+    credit_pattern: ClassVar[re.Pattern] = re.compile(r'(\d+(?:\.\d+)?)\s*(?:credit|credits)', re.IGNORECASE)
     
-    def parse_mdiv_requirements(self, filepath: str) -> List[Requirement]:
+    @_cache_pdf_result('mdiv', Requirement.from_dict)
+    def parse_mdiv_requirements(self, filepath: str, pdf_bytes: Optional[bytes] = None) -> List[Requirement]:
         """Parse MDiv program guide and extract requirements"""
         requirements = []
         
         try:
-            with pdfplumber.open(filepath) as pdf:
-                text = ""
-                for page in pdf.pages:
-                    text += page.extract_text() + "\n"
+            with _open_page_text(pdf_bytes if pdf_bytes is not None else filepath) as pages:
+                text = "\n".join(pages)
                 # Debug: print first 500 characters of extracted text
                 logger.info(f"[DEBUG] First 500 chars from {filepath}:\n{text[:500]}")
                 
@@ -121,39 +322,30 @@ class MDivRequirementParser:
                 ]
                 
                 for req_id, label, default_credits in core_requirements:
-                    # Try to find specific credit requirements in text
+                    # Try to find specific credit requirements in text; only
+                    # the first match for each requirement is used
+                    credits = default_credits
                     pattern = self.requirement_patterns.get(req_id)
-                    if pattern:
-                        matches = pattern.finditer(text)
-                        for match in matches:
-                            # Look for credit information near the match
-                            start = max(0, match.start() - 200)
-                            end = min(len(text), match.end() + 200)
-                            context = text[start:end]
-                            
-                            # Extract credit requirement
-                            credit_match = self.credit_pattern.search(context)
-                            if credit_match:
-                                credits = float(credit_match.group(1))
-                            else:
-                                credits = default_credits
-                            
-                            requirement = Requirement(
-                                id=req_id,
-                                label=label,
-                                min_credits=credits
-                            )
-                            requirements.append(requirement)
-                            break  # Only take first match for each requirement
+                    match = pattern.search(text) if pattern else None
+                    if match:
+                        # Look for credit information near the match
+                        start = max(0, match.start() - 200)
+                        end = min(len(text), match.end() + 200)
+                        context = text[start:end]
+                        
+                        # Extract credit requirement
+                        credit_match = self.credit_pattern.search(context)
+                        if credit_match:
+                            credits = float(credit_match.group(1))
                     
-                    # If no match found, create with default credits
-                    if not any(r.id == req_id for r in requirements):
-                        requirement = Requirement(
-                            id=req_id,
-                            label=label,
-                            min_credits=default_credits
-                        )
-                        requirements.append(requirement)
+                    # Each requirement id is handled exactly once, so no
+                    # duplicate check against the list is needed
+                    requirement = Requirement(
+                        id=req_id,
+                        label=label,
+                        min_credits=credits
+                    )
+                    requirements.append(requirement)
                         
         except Exception as e:
             logger.error(f"Error parsing MDiv requirements from {filepath}: {e}")
@@ -164,17 +356,16 @@ class MDivRequirementParser:
 class DualDegreeParser:
     """Parser for dual-degree specific requirements"""
     
-    def parse_dual_degree_requirements(self, filepath: str) -> List[Requirement]:
+    @_cache_pdf_result('dual-degree', Requirement.from_dict)
+    def parse_dual_degree_requirements(self, filepath: str, pdf_bytes: Optional[bytes] = None) -> List[Requirement]:
         """Parse dual-degree planner and extract MSSW requirements"""
         requirements = []
         
         try:
-            with pdfplumber.open(filepath) as pdf:
-                text = ""
-                for page in pdf.pages:
-                    text += page.extract_text() + "\n"
-                # Debug: print first 500 characters of extracted text
-                logger.info(f"[DEBUG] First 500 chars from {filepath}:\n{text[:500]}")
+            with _open_page_text(pdf_bytes if pdf_bytes is not None else filepath) as pages:
+                # The MSSW requirements below are fixed, so only the first page is read for the debug log
+                first_page = next(pages, "")
+                logger.info(f"[DEBUG] First 500 chars from {filepath}:\n{first_page[:500]}")
                 
                 # Add MSSW-specific requirements
                 mssw_requirements = [
@@ -199,21 +390,45 @@ class DualDegreeParser:
         return requirements
 
 
+COURSE_SCHEDULE_PDFS = [
+    ('_context/2025-Fall-Course-Schedule.pdf', 'Fall 2025'),
+    ('_context/2026-Spring-Course-Schedule.pdf', 'Spring 2026'),
+]
+MDIV_GUIDE_PDF = '_context/MDiv-Program-Guide.AY-24-25.pdf'
+DUAL_DEGREE_PDF = '_context/ML.MDSW-C.24-25.pdf'
+SOURCE_PDFS = [path for path, _ in COURSE_SCHEDULE_PDFS] + [MDIV_GUIDE_PDF, DUAL_DEGREE_PDF]
+
+
 def parse_all_data() -> Tuple[List[Course], List[Requirement]]:
-    """Parse all PDF files and return courses and requirements"""
+    """Parse all PDF files and return courses and requirements
+    
+    PDFs already in the parse cache are answered here. The PDFs are independent
+    and text extraction is CPU-bound, so when several miss the cache each one is
+    parsed in its own worker process.
+    """
     course_parser = CourseScheduleParser()
     mdiv_parser = MDivRequirementParser()
     dual_parser = DualDegreeParser()
     
-    # Parse course schedules
-    courses = []
-    courses.extend(course_parser.parse_schedule_pdf('_context/2025-Fall-Course-Schedule.pdf', 'Fall 2025'))
-    courses.extend(course_parser.parse_schedule_pdf('_context/2026-Spring-Course-Schedule.pdf', 'Spring 2026'))
+    jobs = [(course_parser.parse_schedule_pdf, (filepath, semester)) for filepath, semester in COURSE_SCHEDULE_PDFS]
+    jobs.append((mdiv_parser.parse_mdiv_requirements, (MDIV_GUIDE_PDF,)))
+    jobs.append((dual_parser.parse_dual_degree_requirements, (DUAL_DEGREE_PDF,)))
     
-    # Parse requirements
-    requirements = []
-    requirements.extend(mdiv_parser.parse_mdiv_requirements('_context/MDiv-Program-Guide.AY-24-25.pdf'))
-    requirements.extend(dual_parser.parse_dual_degree_requirements('_context/ML.MDSW-C.24-25.pdf'))
+    results = [method.cached(*args) for method, args in jobs]
+    misses = [i for i, result in enumerate(results) if result is None]
+    # Starting worker processes costs more than parsing a single PDF in place
+    if len(misses) > 1:
+        with ProcessPoolExecutor(max_workers=min(len(misses), os.cpu_count() or 1)) as executor:
+            futures = [(i, executor.submit(jobs[i][0], *jobs[i][1])) for i in misses]
+            for i, future in futures:
+                results[i] = future.result()
+    else:
+        for i in misses:
+            results[i] = jobs[i][0](*jobs[i][1])
+    
+    # Schedules come first, then the MDiv and dual-degree requirements
+    courses = list(chain.from_iterable(results[:len(COURSE_SCHEDULE_PDFS)]))
+    requirements = list(chain.from_iterable(results[len(COURSE_SCHEDULE_PDFS):]))
     
     # Link courses to requirements (simplified mapping)
     link_courses_to_requirements(courses, requirements)
@@ -221,32 +436,73 @@ def parse_all_data() -> Tuple[List[Course], List[Requirement]]:
     return courses, requirements
 
 
+# Simplified mapping - in practice, this would be more sophisticated
+REQUIREMENT_KEYWORDS = {
+    'bible': ['BIBL', 'BIBLE', 'SCRIPTURE'],
+    'historical': ['HIST', 'HISTORY', 'CHURCH'],
+    'interreligious': ['INTER', 'RELIGION', 'DIVERSITY'],
+    'practical': ['PRAC', 'MINISTRY', 'PASTORAL'],
+    'theology_ethics': ['THEO', 'ETHICS', 'MORAL'],
+    'field_ed': ['FIELD', 'INTERN', 'PRACTICUM'],
+    'mssw_core': ['MSSW', 'SOCIAL'],
+    'integrative_seminar': ['SEMINAR', 'INTEGRATIVE'],
+    'social_work_practice': ['PRACTICE', 'CLINICAL'],
+    'social_work_research': ['RESEARCH', 'METHODS'],
+    'social_work_policy': ['POLICY', 'ADVOCACY']
+}
+
+# One compiled alternation per requirement; matches anywhere, like a substring check
+_REQUIREMENT_KEYWORD_RES = {
+    req_id: re.compile('|'.join(map(re.escape, keywords)))
+    for req_id, keywords in REQUIREMENT_KEYWORDS.items()
+}
+
+
+def _build_keyword_automaton():
+    """Aho-Corasick automaton over every keyword, yielding the requirement ids it maps to"""
+    automaton = ahocorasick.Automaton()
+    req_ids_by_keyword: Dict[str, List[str]] = {}
+    for req_id, keywords in REQUIREMENT_KEYWORDS.items():
+        for keyword in keywords:
+            req_ids_by_keyword.setdefault(keyword, []).append(req_id)
+    for keyword, req_ids in req_ids_by_keyword.items():
+        automaton.add_word(keyword, tuple(req_ids))
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton() if ahocorasick is not None else None
+
+
+def _matching_requirement_ids(course_text: str) -> List[str]:
+    """Requirement ids whose keywords occur anywhere in the (uppercased) course text"""
+    if _KEYWORD_AUTOMATON is not None:
+        # One pass over the text finds every keyword, overlapping ones included
+        matched = set()
+        for _, req_ids in _KEYWORD_AUTOMATON.iter(course_text):
+            matched.update(req_ids)
+        return [req_id for req_id in REQUIREMENT_KEYWORDS if req_id in matched]
+    return [req_id for req_id, keyword_re in _REQUIREMENT_KEYWORD_RES.items() if keyword_re.search(course_text)]
+
+
 def link_courses_to_requirements(courses: List[Course], requirements: List[Requirement]):
     """Link courses to requirements based on course codes and titles"""
-    # Simplified mapping - in practice, this would be more sophisticated
-    mapping = {
-        'bible': ['BIBL', 'BIBLE', 'SCRIPTURE'],
-        'historical': ['HIST', 'HISTORY', 'CHURCH'],
-        'interreligious': ['INTER', 'RELIGION', 'DIVERSITY'],
-        'practical': ['PRAC', 'MINISTRY', 'PASTORAL'],
-        'theology_ethics': ['THEO', 'ETHICS', 'MORAL'],
-        'field_ed': ['FIELD', 'INTERN', 'PRACTICUM'],
-        'mssw_core': ['MSSW', 'SOCIAL'],
-        'integrative_seminar': ['SEMINAR', 'INTEGRATIVE'],
-        'social_work_practice': ['PRACTICE', 'CLINICAL'],
-        'social_work_research': ['RESEARCH', 'METHODS'],
-        'social_work_policy': ['POLICY', 'ADVOCACY']
-    }
+    # First requirement with each id wins, as the old linear scan did
+    req_by_id = {}
+    for req in requirements:
+        req_by_id.setdefault(req.id, req)
     
-    for course in courses:
-        course_text = f"{course.code} {course.title}".upper()
+    for i, course in enumerate(courses):
+        satisfies = set(course.satisfies)
         
-        for req_id, keywords in mapping.items():
-            if any(keyword in course_text for keyword in keywords):
-                course.satisfies.add(req_id)
-                
-                # Also add to requirement's satisfied_by set
-                for req in requirements:
-                    if req.id == req_id:
-                        req.satisfied_by.add(course.id)
-                        break 
\ No newline at end of file
+        for req_id in _matching_requirement_ids(course.search_text):
+            satisfies.add(req_id)
+            
+            # Also add to requirement's satisfied_by set
+            req = req_by_id.get(req_id)
+            if req is not None:
+                req.satisfied_by.add(course.id)
+        
+        # Courses are immutable, so swap in an updated copy
+        if satisfies != course.satisfies:
+            courses[i] = replace(course, satisfies=frozenset(satisfies))
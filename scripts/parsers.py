@@ -1,10 +1,16 @@
+import io
 import os
 import re
+import sys
+import json
+import hashlib
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 
 import pdfplumber
 from collections import defaultdict
+from dataclasses import dataclass, asdict, replace
+from concurrent.futures import ProcessPoolExecutor
 
 try:
     from striprtf.striprtf import rtf_to_text
@@ -18,56 +24,103 @@ logging.basicConfig(level=logging.INFO)
 # 1. CONFIGURABLE DATA DIRECTORY & REQUIREMENT MAP
 # ---------------------------------------------------------------------------
 DATA_DIR = os.getenv("DATA_DIR", "./_context")
-
-REQ_MAP: Dict[str, List[str]] = {
-    "BX": ["Bible/Sacred Texts"],
-    "BIBL": ["Bible/Sacred Texts"],
-    "HB": ["Bible/Sacred Texts"],
-    "NT": ["Bible/Sacred Texts"],
-    "CH": ["Historical Studies"],
-    "HS": ["Historical Studies"],
-    "PR": ["Practical Theology"],
-    "PT": ["Practical Theology"],
-    "TH": ["Theology & Ethics"],
-    "ETH": ["Theology & Ethics"],
-    "IE": ["Interreligious Engagement"],
+PARSE_CACHE_DIR = os.getenv("PARSE_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "degree-planner"))
+# Bump whenever parsing output changes, so results cached by older versions are not reused
+PARSER_VERSION = 1
+
+REQ_MAP: Dict[str, Tuple[str, ...]] = {
+    "BX": ("Bible/Sacred Texts",),
+    "BIBL": ("Bible/Sacred Texts",),
+    "HB": ("Bible/Sacred Texts",),
+    "NT": ("Bible/Sacred Texts",),
+    "CH": ("Historical Studies",),
+    "HS": ("Historical Studies",),
+    "PR": ("Practical Theology",),
+    "PT": ("Practical Theology",),
+    "TH": ("Theology & Ethics",),
+    "ETH": ("Theology & Ethics",),
+    "IE": ("Interreligious Engagement",),
     # Social-work prefixes
-    "SW": ["MSSW Core Courses"],
+    "SW": ("MSSW Core Courses",),
 }
+# Interned so every course tagged with a field shares one label string
+REQ_MAP = {prefix: tuple(sys.intern(label) for label in fields) for prefix, fields in REQ_MAP.items()}
+
+# Matches a course code whose first whitespace-separated token is a REQ_MAP key.
+# Generated from the fixed prefix set, longest first so a longer prefix is tried
+# before any shorter one it starts with
+_PREFIX_RE = re.compile(
+    r"^(" + "|".join(map(re.escape, sorted(REQ_MAP, key=len, reverse=True))) + r")(?!\S)"
+)
+# Cached parse results carry their requirement fields, so an edited map invalidates them
+_CACHE_KEY_SALT = repr((PARSER_VERSION, sorted(REQ_MAP.items()))).encode()
 
 # ---------------------------------------------------------------------------
 # 2. TWO-STEP ROW EXTRACTION
 # ---------------------------------------------------------------------------
 
-def _table_rows_from_pdf(path: str) -> List[List[str]]:
+def _rows_from_pdf(path: str, data: bytes | None = None) -> List[List[str]]:
+    """Table rows from every page, or text-line rows if the PDF has no tables.
+
+    Both come from a single pass over the PDF: while no table rows have been
+    found, each page's text is also read (reusing the page's parsed layout)
+    so the fallback never has to reopen and re-parse the file.  ``data`` is
+    the file's already-read contents, if the caller has them.
+    """
+    if data is None:
+        with open(path, "rb") as f:
+            data = f.read()
     rows: List[List[str]] = []
+    page_texts: List[str] = []
     try:
-        with pdfplumber.open(path) as pdf:
+        with pdfplumber.open(io.BytesIO(data)) as pdf:
             for page in pdf.pages:
-                tables = page.extract_tables() or []
+                try:
+                    tables = page.extract_tables() or []
+                except Exception as e:
+                    logger.warning(f"Failed table extraction for {path}: {e}")
+                    tables = []
                 for tbl in tables:
                     for r in tbl:
                         if r and any(cell is not None and str(cell).strip() for cell in r):
                             rows.append([str(cell).strip() if cell is not None else "" for cell in r])
+                if not rows:
+                    page_texts.append(page.extract_text() or "")
+                # Release the page's cached layout objects before moving on
+                page.close()
     except Exception as e:
-        logger.warning(f"Failed table extraction for {path}: {e}")
-    return rows
+        logger.error(f"Failed text extraction for {path}: {e}")
+        raise
+    if rows:
+        return rows
+    # Fallback to text-line splitting
+    return _fallback_rows_from_text("\n".join(page_texts))
+
+
+# Runs of 2+ whitespace characters separate PDF text columns
+_COLUMN_GAP_RE = re.compile(r"\s{2,}")
+_LINE_RE = re.compile(r"[^\n]+")
 
 
 def _fallback_rows_from_text(text: str) -> List[List[str]]:
     rows: List[List[str]] = []
-    for raw_line in text.split("\n"):
-        line = raw_line.rstrip()
-        # Split when we have runs of 2+ spaces (PDF column spacing)
-        parts = re.split(r"\s{2,}", line)
-        parts = [p.strip() for p in parts if p.strip()]
-        if parts:
-            rows.append(parts)
+    # Stream the lines instead of materialising text.split("\n")
+    for m in _LINE_RE.finditer(text):
+        line = m.group().strip()
+        if line:
+            # Split when we have runs of 2+ spaces (PDF column spacing); the
+            # gap regex consumes all whitespace between columns and the line is
+            # stripped, so no part needs stripping or can be empty
+            rows.append(_COLUMN_GAP_RE.split(line))
     return rows
 
 
-def extract_rows(path: str) -> List[List[str]]:
-    """Return a flat list-of-rows where each row is list[str]. Works for PDF & RTF."""
+def extract_rows(path: str, data: bytes | None = None) -> List[List[str]]:
+    """Return a flat list-of-rows where each row is list[str]. Works for PDF & RTF.
+
+    Pass ``data`` (the file's raw bytes) to parse contents already in memory
+    instead of reading ``path`` again.
+    """
     path = os.path.join(DATA_DIR, os.path.basename(path))
     if not os.path.exists(path):
         raise FileNotFoundError(path)
@@ -75,25 +128,15 @@ def extract_rows(path: str) -> List[List[str]]:
     rows: List[List[str]] = []
 
     if path.lower().endswith(".pdf"):
-        # First try table extraction
-        rows = _table_rows_from_pdf(path)
-        if rows:
-            return rows  # success
-        # Fallback to text-line splitting
-        try:
-            with pdfplumber.open(path) as pdf:
-                text = "\n".join(page.extract_text() or "" for page in pdf.pages)
-        except Exception as e:
-            logger.error(f"Failed text extraction for {path}: {e}")
-            raise
-        rows = _fallback_rows_from_text(text)
-        return rows
+        return _rows_from_pdf(path, data)
 
     elif path.lower().endswith(".rtf"):
         if rtf_to_text is None:
             raise RuntimeError("striprtf is required for RTF parsing – install via `pip install striprtf`. ")
-        with open(path, "r", encoding="utf-8", errors="ignore") as f:
-            text = rtf_to_text(f.read())
+        if data is None:
+            with open(path, "rb") as f:
+                data = f.read()
+        text = rtf_to_text(data.decode("utf-8", errors="ignore"))
         rows = _fallback_rows_from_text(text)
         return rows
     else:
@@ -138,34 +181,146 @@ def _build_col_index(header_row: List[str]) -> Dict[str, int]:
     return mapping
 
 
-def row_to_course(row: List[str], col_index: Dict[str, int]) -> Dict[str, Any]:
+@dataclass(slots=True, frozen=True)
+class CourseRow:
+    """One parsed course row; slots keep thousands of rows compact.
+
+    Rows are frozen because memoized parse results are shared between callers.
+    """
+    code: str
+    title: str
+    credits: float
+    professor: str
+    schedule: str
+    description: str
+    fields: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CourseRow":
+        data = dict(data)
+        data["fields"] = tuple(data.get("fields", ()))
+        return cls(**data)
+
+
+def row_to_course(row: List[str], col_index: Dict[str, int]) -> CourseRow:
     def _get(col: str) -> str:
         idx = col_index.get(col)
         return row[idx] if idx is not None and idx < len(row) else ""
 
-    code_raw = _get("Course Code")
-    return {
-        "code": code_raw.strip(),
-        "title": _get("Course Title").strip(),
-        "credits": float(re.split(r"\s", _get("Credits"))[0]) if _get("Credits") else 0.0,
-        "professor": _get("Instructor").strip(),
-        "schedule": _get("Days/Times").strip(),
-        "description": _get("Description").strip(),
-    }
+    code = _get("Course Code").strip()
+    credits_raw = _get("Credits")
+    m = _PREFIX_RE.match(code)
+    return CourseRow(
+        code=code,
+        title=_get("Course Title").strip(),
+        # Cells are already stripped, so the first whitespace-separated token is the number
+        credits=float(credits_raw.split(None, 1)[0]) if credits_raw else 0.0,
+        professor=_get("Instructor").strip(),
+        schedule=_get("Days/Times").strip(),
+        description=_get("Description").strip(),
+        fields=REQ_MAP[m.group(1)] if m else (),
+    )
 
 # ---------------------------------------------------------------------------
 # 4. PARSE FILE -> {courses, totals}
 # ---------------------------------------------------------------------------
 
+PARSE_MEMO_SIZE = 64
+# (path, mtime_ns, size) -> (course rows, totals items), oldest entries evicted first.
+# parse_directory fills it in the parent process, since pool workers' copies die with them
+_PARSE_MEMO: Dict[Tuple[str, int, int], Tuple[Tuple[CourseRow, ...], Tuple[Tuple[str, float], ...]]] = {}
+
+
+def _memo_key(path: str) -> Tuple[str, int, int] | None:
+    # mtime_ns and size are part of the key, so an edited file is parsed again
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return path, st.st_mtime_ns, st.st_size
+
+
+def _remember(key: Tuple[str, int, int], result: Dict[str, Any]) -> None:
+    if len(_PARSE_MEMO) >= PARSE_MEMO_SIZE:
+        _PARSE_MEMO.pop(next(iter(_PARSE_MEMO)), None)
+    _PARSE_MEMO[key] = tuple(result["courses"]), tuple(result["totals"].items())
+
+
+def _recall(key: Tuple[str, int, int] | None) -> Dict[str, Any] | None:
+    entry = _PARSE_MEMO.get(key) if key is not None else None
+    if entry is None:
+        return None
+    courses, totals = entry
+    return {"courses": list(courses), "totals": dict(totals)}
+
+
 def parse_file(path: str) -> Dict[str, Any]:
+    """Parse one PDF/RTF file into ``CourseRow`` objects and per-field credit totals.
+
+    Results are memoized in-process per (path, mtime, size), and on disk for
+    identical file contents.
+    """
     path = os.path.join(DATA_DIR, os.path.basename(path))
+    key = _memo_key(path)
+    if key is None:
+        return _parse_file_uncached(path)  # Raises and logs as usual
+    cached = _recall(key)
+    if cached is not None:
+        return cached
+    result = _parse_file_disk_cached(path)
+    _remember(key, result)
+    return result
+
+
+parse_file.cache_clear = _PARSE_MEMO.clear
+
+
+def _parse_file_disk_cached(path: str) -> Dict[str, Any]:
+    """Parse ``path``, reusing the on-disk result for identical file contents.
+
+    The file is read once; the same bytes are hashed for the cache key and,
+    on a miss, handed to the parser.
+    """
     try:
-        rows = extract_rows(path)
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return _parse_file_uncached(path)  # Raises and logs as usual
+
+    hasher = hashlib.blake2b(data, digest_size=16)
+    hasher.update(_CACHE_KEY_SALT)
+    digest = hasher.hexdigest()
+    cache_path = os.path.join(PARSE_CACHE_DIR, f"file-{digest}.json")
+    if os.path.exists(cache_path):
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            cached["courses"] = [CourseRow.from_dict(c) for c in cached["courses"]]
+            return cached
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable parse cache {cache_path}: {e}")
+
+    result = _parse_file_uncached(path, data)
+    # The cache is best-effort; a read-only or full disk must not fail the parse
+    try:
+        os.makedirs(PARSE_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({**result, "courses": [asdict(c) for c in result["courses"]]}, f)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning(f"Could not write parse cache {cache_path}: {e}")
+    return result
+
+
+def _parse_file_uncached(path: str, data: bytes | None = None) -> Dict[str, Any]:
+    try:
+        rows = extract_rows(path, data)
         header_idx = _find_header_row(rows)
         col_index = _build_col_index(rows[header_idx])
 
-        courses: List[Dict[str, Any]] = []
-        prev_course: Dict[str, Any] | None = None
+        courses: List[CourseRow] = []
+        prev_course: CourseRow | None = None
         for raw_row in rows[header_idx + 1 :]:
             if not raw_row:
                 continue
@@ -173,22 +328,20 @@ def parse_file(path: str) -> Dict[str, Any]:
             if not course_code.strip():
                 # Wrapped description – append
                 if prev_course is not None:
-                    prev_course["description"] += " " + raw_row[col_index["Description"]] if "Description" in col_index and col_index["Description"] < len(raw_row) else " " + " ".join(raw_row)
+                    extra = raw_row[col_index["Description"]] if "Description" in col_index and col_index["Description"] < len(raw_row) else " ".join(raw_row)
+                    courses[-1] = prev_course = replace(prev_course, description=prev_course.description + " " + extra)
                 continue
             # Normal row
             course = row_to_course(raw_row, col_index)
-            # Map to requirements & accumulate credits later
+            # Requirement fields are mapped in row_to_course; credits are tallied below
             courses.append(course)
             prev_course = course
 
-        # Requirement mapping & credit tally
+        # Credit tally per requirement field
         totals: Dict[str, float] = defaultdict(float)
         for c in courses:
-            prefix = re.split(r"\s", c["code"])[0]
-            fields = REQ_MAP.get(prefix, [])
-            c["fields"] = fields
-            for f in fields:
-                totals[f] += c["credits"]
+            for f in c.fields:
+                totals[f] += c.credits
 
         return {"courses": courses, "totals": dict(totals)}
 
@@ -200,18 +353,41 @@ def parse_file(path: str) -> Dict[str, Any]:
 # 5. OPTIONAL DIRECTORY PARSE HELPERS
 # ---------------------------------------------------------------------------
 
+def _parse_file_worker(path: str) -> Dict[str, Any] | None:
+    """Process-pool entry point: parse one file, logging and skipping failures."""
+    try:
+        return parse_file(path)
+    except Exception as e:
+        logger.warning(f"Skipping {os.path.basename(path)}: {e}")
+        return None
+
+
 def parse_directory(directory: str | None = None) -> Dict[str, Any]:
     directory = directory or DATA_DIR
-    data: List[Dict[str, Any]] = []
-    for fname in os.listdir(directory):
-        if fname.lower().endswith((".pdf", ".rtf")):
-            try:
-                data.append(parse_file(os.path.join(directory, fname)))
-            except Exception as e:
-                logger.warning(f"Skipping {fname}: {e}")
+    paths = [
+        os.path.join(directory, fname)
+        for fname in os.listdir(directory)
+        if fname.lower().endswith((".pdf", ".rtf"))
+    ]
+    # Unchanged files are answered from the memo here in the parent; only the rest are parsed
+    keys = [_memo_key(os.path.join(DATA_DIR, os.path.basename(path))) for path in paths]
+    results = [_recall(key) for key in keys]
+    pending = [i for i, result in enumerate(results) if result is None]
+    # Files are independent and PDF extraction is CPU-bound, so parse them in worker processes
+    if len(pending) <= 1:
+        for i in pending:
+            results[i] = _parse_file_worker(paths[i])
+    else:
+        with ProcessPoolExecutor(max_workers=min(len(pending), os.cpu_count() or 1)) as executor:
+            parsed = executor.map(_parse_file_worker, [paths[i] for i in pending])
+            for i, result in zip(pending, parsed):
+                results[i] = result
+                if result is not None and keys[i] is not None:
+                    _remember(keys[i], result)
+    data: List[Dict[str, Any]] = [result for result in results if result is not None]
     # Aggregate totals across files
     agg_totals: Dict[str, float] = defaultdict(float)
-    all_courses: List[Dict[str, Any]] = []
+    all_courses: List[CourseRow] = []
     for d in data:
         all_courses.extend(d["courses"])
         for k, v in d["totals"].items():
@@ -235,7 +411,7 @@ def parse_context_files(directory: str | None = None) -> Dict[str, Any]:
     total_files = len([f for f in os.listdir(directory) if f.lower().endswith((".pdf", ".rtf"))])
 
     return {
-        "courses": parsed["courses"],
+        "courses": [asdict(c) for c in parsed["courses"]],
         "requirements": [],  # TODO: implement real requirement parsing
         "parse_results": [],
         "total_files_processed": total_files,
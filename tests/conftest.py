@@ -0,0 +1,70 @@
+"""
+Shared fixtures for the planner unit tests
+"""
+import pytest
+from models import Course
+
+
+def _make_course(**overrides) -> Course:
+    """Build a Course from a Fall 2025 Bible-course template, overriding any field"""
+    fields = {
+        'id': 'BIBL101',
+        'code': 'BIBL 101',
+        'title': 'Biblical Studies I',
+        'faculty': 'Dr. Smith',
+        'credits': 3.0,
+        'days': 'MW',
+        'time': '10:00-11:30',
+        'semester': 'Fall 2025',
+        'delivery_mode': 'In Person',
+        'description': 'Biblical studies course',
+    }
+    fields.update(overrides)
+    return Course(**fields)
+
+
+@pytest.fixture(scope="module")
+def make_course():
+    """Factory for courses that differ from the template in a few fields"""
+    return _make_course
+
+
+@pytest.fixture(scope="module")
+def bible_course_12():
+    return _make_course(credits=12.0, satisfies={'bible'})
+
+
+@pytest.fixture(scope="module")
+def bible_course_6():
+    return _make_course(credits=6.0, satisfies={'bible'})
+
+
+@pytest.fixture(scope="module")
+def bible_course_6_spring():
+    return _make_course(
+        id='BIBL201',
+        code='BIBL 201',
+        title='Biblical Studies II',
+        faculty='Dr. Jones',
+        credits=6.0,
+        days='TR',
+        time='14:00-15:30',
+        semester='Spring 2026',
+        description='Advanced biblical studies',
+        satisfies={'bible'}
+    )
+
+
+@pytest.fixture(scope="module")
+def theology_course_9():
+    return _make_course(
+        id='THEO201',
+        code='THEO 201',
+        title='Theology I',
+        faculty='Dr. Jones',
+        credits=9.0,
+        days='TR',
+        time='14:00-15:30',
+        description='Theology course',
+        satisfies={'theology'}
+    )
@@ -2,9 +2,12 @@
 Unit tests for data models
 """
 import pytest
+import dataclasses
 import json
+import os
+import threading
 from datetime import datetime
-from models import Course, Requirement, Plan
+from models import Course, Requirement, Plan, CourseTable
 
 
 class TestRequirement:
@@ -74,7 +77,7 @@ class TestCourse:
         assert course.semester == 'Fall 2025'
         assert course.delivery_mode == 'In Person'
         assert course.description == 'An introduction to biblical texts.'
-        assert course.satisfies == set()
+        assert course.satisfies == frozenset()
     
     def test_course_to_dict(self):
         """Test converting course to dictionary"""
@@ -88,10 +91,9 @@ class TestCourse:
             time='10:00-11:30',
             semester='Fall 2025',
             delivery_mode='In Person',
-            description='An introduction to biblical texts.'
+            description='An introduction to biblical texts.',
+            satisfies={'bible', 'electives'}
         )
-        course.satisfies.add('bible')
-        course.satisfies.add('electives')
         
         data = course.to_dict()
         assert data['id'] == 'BIBL101_Fall2025_Smith'
@@ -134,6 +136,27 @@ class TestCourse:
         assert course.delivery_mode == 'In Person'
         assert course.description == 'An introduction to biblical texts.'
         assert course.satisfies == {'bible', 'electives'}
+    
+    def test_course_is_immutable_and_hashable(self):
+        """Test that courses are frozen, hashable, and store satisfies as a frozenset"""
+        course = Course(
+            id='BIBL101_Fall2025_Smith',
+            code='BIBL 101',
+            title='Introduction to Biblical Studies',
+            faculty='Dr. Smith',
+            credits=3.0,
+            days='MW',
+            time='10:00-11:30',
+            semester='Fall 2025',
+            delivery_mode='In Person',
+            description='An introduction to biblical texts.',
+            satisfies={'bible'}
+        )
+        
+        assert isinstance(course.satisfies, frozenset)
+        assert course in {course}
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            course.credits = 4.0
 
 
 class TestPlan:
@@ -214,4 +237,92 @@ class TestPlan:
         plan.add_course('Fall 2025', 'course1')
         plan.add_course('Fall 2025', 'course1')  # Duplicate
         
-        assert plan.selections['Fall 2025'] == ['course1']  # Only one instance 
\ No newline at end of file
+        assert plan.selections['Fall 2025'] == ['course1']  # Only one instance 
+    
+    def test_plan_save_and_load_round_trip(self, tmp_path):
+        """Test saving a plan to disk and loading it back"""
+        plan = Plan()
+        plan.add_course('Fall 2025', 'course1')
+        plan.notes = "Test plan"
+        filepath = str(tmp_path / 'plan.json')
+        
+        plan.save_to_file(filepath)
+        loaded = Plan.load_from_file(filepath)
+        
+        assert loaded.selections == {'Fall 2025': ['course1']}
+        assert loaded.notes == "Test plan"
+        assert loaded.updated_at == plan.updated_at
+    
+    def test_plan_save_skips_unchanged_plan(self, tmp_path):
+        """Test that saving an unchanged plan doesn't rewrite the file"""
+        plan = Plan()
+        plan.add_course('Fall 2025', 'course1')
+        filepath = tmp_path / 'plan.json'
+        
+        plan.save_to_file(str(filepath))
+        os.utime(filepath, ns=(0, 0))
+        plan.save_to_file(str(filepath))
+        assert filepath.stat().st_mtime_ns == 0
+        
+        plan.add_course('Fall 2025', 'course2')
+        plan.save_to_file(str(filepath))
+        assert filepath.stat().st_mtime_ns != 0
+    
+    def test_plan_concurrent_saves_use_separate_temp_files(self, tmp_path):
+        """Test that saves from several threads at once all land without clobbering each other"""
+        filepath = str(tmp_path / 'plan.json')
+        plans = [Plan(notes=f"writer {i}") for i in range(8)]
+        threads = [threading.Thread(target=plan.save_to_file, args=(filepath,)) for plan in plans]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert Plan.load_from_file(filepath).notes in {plan.notes for plan in plans}
+        assert os.listdir(tmp_path) == ['plan.json']
+    
+    def test_plan_updated_at_stamped_on_save(self, tmp_path):
+        """Test that edits leave updated_at alone until the plan is saved"""
+        plan = Plan(updated_at=datetime(2023, 1, 1))
+        plan.add_course('Fall 2025', 'course1')
+        plan.remove_course('Fall 2025', 'course1')
+        plan.add_course('Fall 2025', 'course2')
+        assert plan.updated_at == datetime(2023, 1, 1)
+        
+        plan.save_to_file(str(tmp_path / 'plan.json'))
+        assert plan.updated_at > datetime(2023, 1, 1)
+    
+    def test_plan_load_missing_file(self, tmp_path):
+        """Test loading a plan that was never saved returns an empty plan"""
+        plan = Plan.load_from_file(str(tmp_path / 'missing.json'))
+        assert plan.selections == {}
+
+
+class TestCourseTable:
+    """Test CourseTable column view"""
+    
+    def test_course_table_filters(self, make_course):
+        """Test combining semester, requirement, credit and search masks"""
+        courses = [
+            make_course(id='BIBL101', code='BIBL101', title='Biblical Studies', credits=3.0, satisfies={'bible'}),
+            make_course(id='HIST201', code='HIST201', title='Church History', credits=4.0, satisfies={'historical'}),
+            make_course(id='THEO301', code='THEO301', title='Theology', credits=2.0, semester='Spring 2026',
+                        satisfies={'theology_ethics', 'bible'}),
+        ]
+        table = CourseTable.from_courses(courses)
+        
+        assert table.select(table.semester_mask('Fall 2025')) == courses[:2]
+        assert table.select(table.semester_mask('Summer 2025')) == []
+        assert table.select(table.requirement_mask(['bible'])) == [courses[0], courses[2]]
+        assert table.select(table.requirement_mask(['unknown'])) == []
+        assert table.select(table.credit_mask(4)) == [courses[1]]
+        assert table.select(table.credit_mask(1, 3)) == [courses[0], courses[2]]
+        assert table.select(table.search_mask('church')) == [courses[1]]
+        assert table.select(table.semester_mask('Fall 2025') & table.requirement_mask(['bible'])) == [courses[0]]
+    
+    def test_course_table_empty(self):
+        """Test building a table with no courses"""
+        table = CourseTable.from_courses([])
+        assert table.select(table.all()) == []
+        assert table.select(table.search_mask('BIBL')) == []
+
@@ -1,5 +1,6 @@
 import os
 import pytest
+from contextlib import contextmanager
 
 from scripts.parsers import parse_file
 
@@ -12,4 +13,226 @@ def test_parse_file_returns_courses_and_totals():
     assert data["totals"], "Expected credit totals populated"
     # Sanity: at least one Bible bucket populated if present
     if "Bible/Sacred Texts" in data["totals"]:
-        assert data["totals"]["Bible/Sacred Texts"] > 0 
\ No newline at end of file
+        assert data["totals"]["Bible/Sacred Texts"] > 0 
+
+SCHEDULE_TEXT = """Fall 2025 Course Schedule
+BIBL 101 Introduction to the Bible Dr. Jane Smith 3 MW 10:00-11:30 In Person Survey of biblical
+literature and interpretation.
+THEO 301  Systematic Theology  Prof. Brown  3.0  TR  2:00-3:30PM  Hybrid  Core doctrines
+"""
+
+
+def test_parse_schedule_text_splits_course_lines():
+    from parsers import CourseScheduleParser
+
+    courses = CourseScheduleParser().parse_schedule_text(SCHEDULE_TEXT, "Fall 2025")
+    assert [c.code for c in courses] == ["BIBL 101", "THEO 301"]
+
+    bible, theology = courses
+    assert bible.title == "Introduction to the Bible"
+    assert bible.faculty == "Dr. Jane Smith"
+    assert (bible.credits, bible.days, bible.time) == (3.0, "MW", "10:00-11:30")
+    assert bible.delivery_mode == "In Person"
+    # Continuation lines are folded into the description until the next course code
+    assert bible.description == "Survey of biblical literature and interpretation."
+
+    assert theology.title == "Systematic Theology"
+    assert theology.faculty == "Prof. Brown"
+    assert theology.delivery_mode == "Hybrid"
+    assert theology.description == "Core doctrines"
+
+
+def test_parse_schedule_text_keeps_courses_without_faculty():
+    from parsers import CourseScheduleParser
+
+    text = "BIBL 101 Introduction to the Bible Jane Smith 3 MW 10:00-11:30 In Person Survey\n"
+    courses = CourseScheduleParser().parse_schedule_text(text, "Fall 2025")
+    assert [c.code for c in courses] == ["BIBL 101"]
+    # Single-spaced lines without a Dr/Prof/Rev prefix leave faculty inside the title
+    assert courses[0].faculty == ""
+    assert courses[0].id == "BIBL 101_Fall 2025_TBA"
+
+
+def test_parse_schedule_text_skips_lines_without_schedule():
+    from parsers import CourseScheduleParser
+
+    text = "BIBL 101 Introduction to the Bible\nno schedule on this one"
+    assert CourseScheduleParser().parse_schedule_text(text, "Fall 2025") == []
+
+
+def test_parse_schedule_pdf_is_cached_by_content(tmp_path, monkeypatch):
+    import parsers
+
+    opened = []
+
+    @contextmanager
+    def fake_open_page_text(source):
+        opened.append(source)
+        yield iter([SCHEDULE_TEXT])
+
+    monkeypatch.setattr(parsers, "PARSE_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(parsers, "_open_page_text", fake_open_page_text)
+    pdf_path = tmp_path / "schedule.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4 fake schedule")
+
+    parser = parsers.CourseScheduleParser()
+    first = parser.parse_schedule_pdf(str(pdf_path), "Fall 2025")
+    second = parser.parse_schedule_pdf(str(pdf_path), "Fall 2025")
+
+    assert [c.code for c in first] == ["BIBL 101", "THEO 301"]
+    # The parser is handed the bytes already read for hashing, not the path
+    assert opened == [b"%PDF-1.4 fake schedule"]
+    assert second == first
+
+    # Different contents or a different semester are separate cache entries
+    parser.parse_schedule_pdf(str(pdf_path), "Spring 2026")
+    pdf_path.write_bytes(b"%PDF-1.4 edited schedule")
+    parser.parse_schedule_pdf(str(pdf_path), "Fall 2025")
+    assert len(opened) == 3
+
+    # A parser version bump ignores results cached by the old version
+    monkeypatch.setattr(parsers, "PARSER_VERSION", parsers.PARSER_VERSION + 1)
+    parser.parse_schedule_pdf(str(pdf_path), "Fall 2025")
+    assert len(opened) == 4
+
+
+def test_parse_schedule_pdf_survives_unwritable_cache(tmp_path, monkeypatch):
+    import parsers
+
+    @contextmanager
+    def fake_open_page_text(source):
+        yield iter([SCHEDULE_TEXT])
+
+    # A regular file where the cache directory should be makes every cache write fail
+    (tmp_path / "cache").write_text("not a directory")
+    monkeypatch.setattr(parsers, "PARSE_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(parsers, "_open_page_text", fake_open_page_text)
+    pdf_path = tmp_path / "schedule.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4 fake schedule")
+
+    courses = parsers.CourseScheduleParser().parse_schedule_pdf(str(pdf_path), "Fall 2025")
+    assert [c.code for c in courses] == ["BIBL 101", "THEO 301"]
+
+
+def test_parse_all_data_skips_the_pool_for_cached_pdfs(tmp_path, monkeypatch):
+    import parsers
+    from models import Requirement
+
+    @contextmanager
+    def fake_open_page_text(source):
+        yield iter([SCHEDULE_TEXT])
+
+    monkeypatch.setattr(parsers, "PARSE_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(parsers, "_open_page_text", fake_open_page_text)
+    schedules = [(str(tmp_path / f"{semester}.pdf"), semester) for semester in ("Fall 2025", "Spring 2026")]
+    for filepath, semester in schedules:
+        open(filepath, "wb").write(f"%PDF-1.4 {semester}".encode())
+        parsers.CourseScheduleParser().parse_schedule_pdf(filepath, semester)
+    monkeypatch.setattr(parsers, "COURSE_SCHEDULE_PDFS", schedules)
+    bible = Requirement("bible", "Bible", 12.0)
+    monkeypatch.setattr(parsers.MDivRequirementParser.parse_mdiv_requirements, "cached", lambda *args: [bible])
+    def parse_dual_degree_requirements(self, filepath):
+        return []
+    parse_dual_degree_requirements.cached = lambda *args: None
+    monkeypatch.setattr(parsers.DualDegreeParser, "parse_dual_degree_requirements", parse_dual_degree_requirements)
+    monkeypatch.setattr(parsers, "ProcessPoolExecutor", lambda **kwargs: pytest.fail("pool started"))
+
+    # Cache hits are answered in this process, and a single miss is parsed in place
+    courses, requirements = parsers.parse_all_data()
+    assert [c.code for c in courses] == ["BIBL 101", "THEO 301"] * 2
+    assert requirements == [bible]
+
+
+def test_page_text_uses_pdftotext_when_enabled(monkeypatch):
+    import parsers
+
+    class FakePdftotext:
+        @staticmethod
+        def PDF(f, physical=False):
+            assert physical and f.read() == b"%PDF-1.4 fake"
+            return ["page one", "page two"]
+
+    monkeypatch.setattr(parsers, "pdftotext", FakePdftotext)
+    monkeypatch.setattr(parsers, "USE_PDFTOTEXT", True)
+    with parsers._open_page_text(b"%PDF-1.4 fake") as pages:
+        assert list(pages) == ["page one", "page two"]
+
+
+@pytest.mark.parametrize("use_automaton", [True, False], ids=["aho-corasick", "regex"])
+def test_link_courses_to_requirements(use_automaton, monkeypatch, make_course):
+    import parsers
+    from models import Requirement
+    from parsers import link_courses_to_requirements
+
+    if not use_automaton:
+        monkeypatch.setattr(parsers, "_KEYWORD_AUTOMATON", None)
+    elif parsers._KEYWORD_AUTOMATON is None:
+        pytest.skip("pyahocorasick not installed")
+
+    courses = [
+        make_course(id=code, code=code, title=title)
+        for code, title in [
+            ("BIBL 101", "Introduction to the Bible"),
+            ("SW 501", "Clinical Social Work Practice"),
+            ("ART 100", "Drawing"),
+        ]
+    ]
+    bible = Requirement("bible", "Bible/Sacred Texts", 12.0)
+    practice = Requirement("social_work_practice", "Social Work Practice", 12.0)
+
+    link_courses_to_requirements(courses, [bible, practice])
+
+    assert courses[0].satisfies == {"bible"}
+    # Substring matching: "PRACTICE" also contains the "PRAC" keyword
+    assert courses[1].satisfies == {"mssw_core", "practical", "social_work_practice"}
+    assert courses[2].satisfies == frozenset()
+    assert bible.satisfied_by == {"BIBL 101"}
+    assert practice.satisfied_by == {"SW 501"}
+
+
+def test_parse_file_returns_course_rows_from_cache(tmp_path, monkeypatch):
+    from scripts import parsers as script_parsers
+
+    (tmp_path / "schedule.pdf").write_bytes(b"%PDF-fake")
+    rows = [
+        ["Course Code", "Course Title", "Credits", "Instructor", "Description"],
+        ["BX 101", "Bible", "3", "Smith", "Intro"],
+        ["", "", "", "", "continued"],
+        ["SW 200", "Social Work", "1.5", "", ""],
+    ]
+    monkeypatch.setattr(script_parsers, "DATA_DIR", str(tmp_path))
+    monkeypatch.setattr(script_parsers, "PARSE_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(script_parsers, "extract_rows", lambda path, data=None: rows)
+
+    first = script_parsers.parse_file("schedule.pdf")
+    bible, social = first["courses"]
+    assert isinstance(bible, script_parsers.CourseRow)
+    assert (bible.code, bible.credits, bible.description) == ("BX 101", 3.0, "Intro continued")
+    assert bible.fields == ("Bible/Sacred Texts",)
+    assert first["totals"] == {"Bible/Sacred Texts": 3.0, "MSSW Core Courses": 1.5}
+
+    # Repeat calls are memoized in-process, and the JSON cache rebuilds the same rows
+    monkeypatch.setattr(script_parsers, "extract_rows", lambda path, data=None: pytest.fail("cache miss"))
+    assert script_parsers.parse_file("schedule.pdf") == first
+    script_parsers.parse_file.cache_clear()
+    assert script_parsers.parse_file("schedule.pdf") == first
+
+
+def test_parse_directory_answers_unchanged_files_from_memo(tmp_path, monkeypatch):
+    from scripts import parsers as script_parsers
+
+    rows = [["Course Code", "Course Title", "Credits"], ["BX 101", "Bible", "3"]]
+    for name in ("fall.pdf", "spring.pdf"):
+        (tmp_path / name).write_bytes(f"%PDF-{name}".encode())
+    monkeypatch.setattr(script_parsers, "DATA_DIR", str(tmp_path))
+    monkeypatch.setattr(script_parsers, "PARSE_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(script_parsers, "extract_rows", lambda path, data=None: rows)
+    script_parsers.parse_file.cache_clear()
+    for name in ("fall.pdf", "spring.pdf"):
+        script_parsers.parse_file(name)
+
+    # Both files are memoized in this process, so no worker pool is started
+    monkeypatch.setattr(script_parsers, "ProcessPoolExecutor", lambda **kwargs: pytest.fail("pool started"))
+    result = script_parsers.parse_directory(str(tmp_path))
+    assert [c.code for c in result["courses"]] == ["BX 101", "BX 101"]
+    assert result["totals"] == {"Bible/Sacred Texts": 6.0}
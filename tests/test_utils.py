@@ -3,8 +3,9 @@ Unit tests for utility functions
 """
 import pytest
 import tempfile
+import io
 import os
-from models import Course, Requirement, Plan
+from models import Requirement, Plan
 from utils import (
     validate_requirements,
     calculate_total_credits,
@@ -13,282 +14,144 @@ from utils import (
     get_courses_by_semester,
     format_time_slot,
     format_days,
-    get_requirement_progress
+    get_requirement_progress,
+    compute_all
 )
 
 
 class TestValidation:
     """Test requirement validation functions"""
     
-    def test_validate_requirements_met(self):
-        """Test validation when all requirements are met"""
-        # Create requirements
-        bible_req = Requirement('bible', 'Bible/Sacred Texts', 12.0)
-        theo_req = Requirement('theology', 'Theology & Ethics', 9.0)
-        requirements = [bible_req, theo_req]
+    @pytest.mark.parametrize("course_fixtures, requirement_specs, plan_entries, expected", [
+        # All requirements met
+        (
+            ['bible_course_12', 'theology_course_9'],
+            [('bible', 'Bible/Sacred Texts', 12.0), ('theology', 'Theology & Ethics', 9.0)],
+            [('Fall 2025', 'BIBL101'), ('Fall 2025', 'THEO201')],
+            {'bible': (True, 12.0, 0.0, 1), 'theology': (True, 9.0, 0.0, 1)},
+        ),
+        # Insufficient credits
+        (
+            ['bible_course_6'],
+            [('bible', 'Bible/Sacred Texts', 12.0)],
+            [('Fall 2025', 'BIBL101')],
+            {'bible': (False, 6.0, 6.0, 1)},
+        ),
+        # Multiple courses satisfying the same requirement across semesters
+        (
+            ['bible_course_6', 'bible_course_6_spring'],
+            [('bible', 'Bible/Sacred Texts', 12.0)],
+            [('Fall 2025', 'BIBL101'), ('Spring 2026', 'BIBL201')],
+            {'bible': (True, 12.0, 0.0, 2)},
+        ),
+    ], ids=['met', 'not_met', 'multiple_courses'])
+    def test_validate_requirements(self, request, course_fixtures, requirement_specs, plan_entries, expected):
+        """Test validation totals, deficits and selected courses per requirement"""
+        courses = [request.getfixturevalue(name) for name in course_fixtures]
+        requirements = [Requirement(*spec) for spec in requirement_specs]
         
-        # Create courses
-        course1 = Course(
-            id='BIBL101',
-            code='BIBL 101',
-            title='Biblical Studies I',
-            faculty='Dr. Smith',
-            credits=12.0,
-            days='MW',
-            time='10:00-11:30',
-            semester='Fall 2025',
-            delivery_mode='In Person',
-            description='Biblical studies course',
-            satisfies={'bible'}
-        )
-        
-        course2 = Course(
-            id='THEO201',
-            code='THEO 201',
-            title='Theology I',
-            faculty='Dr. Jones',
-            credits=9.0,
-            days='TR',
-            time='14:00-15:30',
-            semester='Fall 2025',
-            delivery_mode='In Person',
-            description='Theology course',
-            satisfies={'theology'}
-        )
-        
-        courses = [course1, course2]
-        
-        # Create plan
         plan = Plan()
-        plan.add_course('Fall 2025', 'BIBL101')
-        plan.add_course('Fall 2025', 'THEO201')
+        for semester, course_id in plan_entries:
+            plan.add_course(semester, course_id)
         
-        # Validate
         results = validate_requirements(plan, courses, requirements)
         
-        assert results['bible']['is_met'] == True
-        assert results['bible']['total_credits'] == 12.0
-        assert results['bible']['deficit'] == 0.0
-        
-        assert results['theology']['is_met'] == True
-        assert results['theology']['total_credits'] == 9.0
-        assert results['theology']['deficit'] == 0.0
+        for req_id, (is_met, total_credits, deficit, selected_count) in expected.items():
+            assert results[req_id]['is_met'] == is_met
+            assert results[req_id]['total_credits'] == total_credits
+            assert results[req_id]['deficit'] == deficit
+            assert len(results[req_id]['selected_courses']) == selected_count
     
-    def test_validate_requirements_not_met(self):
-        """Test validation when requirements are not met"""
-        # Create requirement
-        bible_req = Requirement('bible', 'Bible/Sacred Texts', 12.0)
-        requirements = [bible_req]
-        
-        # Create course with insufficient credits
-        course = Course(
-            id='BIBL101',
-            code='BIBL 101',
-            title='Biblical Studies I',
-            faculty='Dr. Smith',
-            credits=6.0,
-            days='MW',
-            time='10:00-11:30',
-            semester='Fall 2025',
-            delivery_mode='In Person',
-            description='Biblical studies course',
-            satisfies={'bible'}
-        )
-        
-        courses = [course]
-        
-        # Create plan
+    def test_validate_requirements_sees_edits(self, bible_course_6, make_course):
+        """Test that validating again reflects plan, requirement and catalog edits"""
+        requirements = [Requirement('bible', 'Bible/Sacred Texts', 12.0)]
+        courses = [bible_course_6]
         plan = Plan()
         plan.add_course('Fall 2025', 'BIBL101')
+        assert validate_requirements(plan, courses, requirements)['bible']['total_credits'] == 6.0
         
-        # Validate
-        results = validate_requirements(plan, courses, requirements)
-        
-        assert results['bible']['is_met'] == False
-        assert results['bible']['total_credits'] == 6.0
-        assert results['bible']['deficit'] == 6.0
-    
-    def test_validate_requirements_multiple_courses(self):
-        """Test validation with multiple courses satisfying same requirement"""
-        # Create requirement
-        bible_req = Requirement('bible', 'Bible/Sacred Texts', 12.0)
-        requirements = [bible_req]
-        
-        # Create courses
-        course1 = Course(
-            id='BIBL101',
-            code='BIBL 101',
-            title='Biblical Studies I',
-            faculty='Dr. Smith',
-            credits=6.0,
-            days='MW',
-            time='10:00-11:30',
-            semester='Fall 2025',
-            delivery_mode='In Person',
-            description='Biblical studies course',
-            satisfies={'bible'}
-        )
-        
-        course2 = Course(
-            id='BIBL201',
-            code='BIBL 201',
-            title='Biblical Studies II',
-            faculty='Dr. Jones',
-            credits=6.0,
-            days='TR',
-            time='14:00-15:30',
-            semester='Spring 2026',
-            delivery_mode='In Person',
-            description='Advanced biblical studies',
-            satisfies={'bible'}
-        )
-        
-        courses = [course1, course2]
-        
-        # Create plan
-        plan = Plan()
+        plan.remove_course('Fall 2025', 'BIBL101')
+        assert validate_requirements(plan, courses, requirements)['bible']['total_credits'] == 0.0
         plan.add_course('Fall 2025', 'BIBL101')
-        plan.add_course('Spring 2026', 'BIBL201')
+        requirements[0].min_credits = 6.0
+        assert validate_requirements(plan, courses, requirements)['bible']['is_met'] == True
         
-        # Validate
-        results = validate_requirements(plan, courses, requirements)
-        
-        assert results['bible']['is_met'] == True
-        assert results['bible']['total_credits'] == 12.0
-        assert len(results['bible']['selected_courses']) == 2
+        # Replacing a course in the same list is picked up too
+        courses[0] = make_course(credits=3.0, satisfies={'bible'})
+        assert validate_requirements(plan, courses, requirements)['bible']['total_credits'] == 3.0
 
 
 class TestCreditCalculations:
     """Test credit calculation functions"""
     
-    def test_calculate_total_credits_all_semesters(self):
-        """Test calculating total credits across all semesters"""
-        # Create courses
-        course1 = Course(
-            id='BIBL101',
-            code='BIBL 101',
-            title='Biblical Studies I',
-            faculty='Dr. Smith',
-            credits=3.0,
-            days='MW',
-            time='10:00-11:30',
-            semester='Fall 2025',
-            delivery_mode='In Person',
-            description='Biblical studies course'
-        )
-        
-        course2 = Course(
-            id='THEO201',
-            code='THEO 201',
-            title='Theology I',
-            faculty='Dr. Jones',
-            credits=3.0,
-            days='TR',
-            time='14:00-15:30',
-            semester='Spring 2026',
-            delivery_mode='In Person',
-            description='Theology course'
-        )
-        
-        courses = [course1, course2]
-        
-        # Create plan
+    @pytest.fixture
+    def courses(self, make_course):
+        return [
+            make_course(),
+            make_course(
+                id='THEO201',
+                code='THEO 201',
+                title='Theology I',
+                faculty='Dr. Jones',
+                days='TR',
+                time='14:00-15:30',
+                semester='Spring 2026',
+                description='Theology course'
+            ),
+        ]
+    
+    @pytest.fixture
+    def plan(self):
         plan = Plan()
         plan.add_course('Fall 2025', 'BIBL101')
         plan.add_course('Spring 2026', 'THEO201')
-        
-        # Calculate total
+        return plan
+    
+    def test_calculate_total_credits_all_semesters(self, plan, courses):
+        """Test calculating total credits across all semesters"""
         total = calculate_total_credits(plan, courses)
         assert total == 6.0
     
-    def test_calculate_total_credits_specific_semester(self):
+    def test_calculate_total_credits_specific_semester(self, plan, courses):
         """Test calculating total credits for a specific semester"""
-        # Create courses
-        course1 = Course(
-            id='BIBL101',
-            code='BIBL 101',
-            title='Biblical Studies I',
-            faculty='Dr. Smith',
-            credits=3.0,
-            days='MW',
-            time='10:00-11:30',
-            semester='Fall 2025',
-            delivery_mode='In Person',
-            description='Biblical studies course'
-        )
-        
-        course2 = Course(
-            id='THEO201',
-            code='THEO 201',
-            title='Theology I',
-            faculty='Dr. Jones',
-            credits=3.0,
-            days='TR',
-            time='14:00-15:30',
-            semester='Spring 2026',
-            delivery_mode='In Person',
-            description='Theology course'
-        )
-        
-        courses = [course1, course2]
-        
-        # Create plan
-        plan = Plan()
-        plan.add_course('Fall 2025', 'BIBL101')
-        plan.add_course('Spring 2026', 'THEO201')
-        
-        # Calculate for specific semester
         fall_total = calculate_total_credits(plan, courses, 'Fall 2025')
         assert fall_total == 3.0
         
         spring_total = calculate_total_credits(plan, courses, 'Spring 2026')
         assert spring_total == 3.0
+    
+    def test_calculate_total_credits_sees_in_place_edits(self, plan, courses, make_course):
+        """Test that replacing a course in the same list is reflected in the next total"""
+        assert calculate_total_credits(plan, courses) == 6.0
+        courses[0] = make_course(credits=4.0)
+        assert calculate_total_credits(plan, courses) == 7.0
 
 
 class TestFiltering:
     """Test course filtering functions"""
     
-    def test_get_courses_by_requirement(self):
+    def test_get_courses_by_requirement(self, make_course):
         """Test filtering courses by requirement"""
         # Create courses
-        course1 = Course(
-            id='BIBL101',
-            code='BIBL 101',
-            title='Biblical Studies I',
-            faculty='Dr. Smith',
-            credits=3.0,
-            days='MW',
-            time='10:00-11:30',
-            semester='Fall 2025',
-            delivery_mode='In Person',
-            description='Biblical studies course',
-            satisfies={'bible'}
-        )
-        
-        course2 = Course(
+        course1 = make_course(satisfies={'bible'})
+        course2 = make_course(
             id='THEO201',
             code='THEO 201',
             title='Theology I',
             faculty='Dr. Jones',
-            credits=3.0,
             days='TR',
             time='14:00-15:30',
-            semester='Fall 2025',
-            delivery_mode='In Person',
             description='Theology course',
             satisfies={'theology'}
         )
-        
-        course3 = Course(
+        course3 = make_course(
             id='BIBL201',
             code='BIBL 201',
             title='Biblical Studies II',
             faculty='Dr. Brown',
-            credits=3.0,
             days='F',
             time='09:00-12:00',
             semester='Spring 2026',
-            delivery_mode='In Person',
             description='Advanced biblical studies',
             satisfies={'bible', 'electives'}
         )
@@ -304,32 +167,18 @@ class TestFiltering:
         assert len(theology_courses) == 1
         assert theology_courses[0].code == 'THEO 201'
     
-    def test_get_courses_by_semester(self):
+    def test_get_courses_by_semester(self, make_course):
         """Test filtering courses by semester"""
         # Create courses
-        course1 = Course(
-            id='BIBL101',
-            code='BIBL 101',
-            title='Biblical Studies I',
-            faculty='Dr. Smith',
-            credits=3.0,
-            days='MW',
-            time='10:00-11:30',
-            semester='Fall 2025',
-            delivery_mode='In Person',
-            description='Biblical studies course'
-        )
-        
-        course2 = Course(
+        course1 = make_course()
+        course2 = make_course(
             id='THEO201',
             code='THEO 201',
             title='Theology I',
             faculty='Dr. Jones',
-            credits=3.0,
             days='TR',
             time='14:00-15:30',
             semester='Spring 2026',
-            delivery_mode='In Person',
             description='Theology course'
         )
         
@@ -368,24 +217,9 @@ class TestFormatting:
 class TestExport:
     """Test export functions"""
     
-    def test_export_plan_to_csv(self):
+    def test_export_plan_to_csv(self, make_course):
         """Test exporting plan to CSV"""
-        # Create courses
-        course1 = Course(
-            id='BIBL101',
-            code='BIBL 101',
-            title='Biblical Studies I',
-            faculty='Dr. Smith',
-            credits=3.0,
-            days='MW',
-            time='10:00-11:30',
-            semester='Fall 2025',
-            delivery_mode='In Person',
-            description='Biblical studies course',
-            satisfies={'bible'}
-        )
-        
-        courses = [course1]
+        courses = [make_course(satisfies={'bible'})]
         
         # Create plan
         plan = Plan()
@@ -393,7 +227,7 @@ class TestExport:
         
         # Export to temporary file
         with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as tmp_file:
-            df = export_plan_to_csv(plan, courses, tmp_file.name)
+            df = export_plan_to_csv(plan, courses, tmp_file.name, return_df=True)
             
             # Check that file was created
             assert os.path.exists(tmp_file.name)
@@ -406,12 +240,26 @@ class TestExport:
             
             # Clean up
             os.unlink(tmp_file.name)
+    
+    def test_export_plan_to_csv_buffer(self, make_course):
+        """Test exporting plan to an in-memory text buffer"""
+        course1 = make_course(satisfies={'bible'})
+        
+        plan = Plan()
+        plan.add_course('Fall 2025', 'BIBL101')
+        
+        buffer = io.StringIO()
+        export_plan_to_csv(plan, [course1], buffer)
+        
+        lines = buffer.getvalue().splitlines()
+        assert lines[0].startswith('Semester,Course Code,Course Title')
+        assert lines[1].startswith('Fall 2025,BIBL 101,Biblical Studies I')
 
 
 class TestProgress:
     """Test progress calculation functions"""
     
-    def test_get_requirement_progress(self):
+    def test_get_requirement_progress(self, bible_course_12, make_course):
         """Test requirement progress calculation"""
         # Create requirements
         bible_req = Requirement('bible', 'Bible/Sacred Texts', 12.0)
@@ -419,21 +267,7 @@ class TestProgress:
         requirements = [bible_req, theo_req]
         
         # Create courses
-        course1 = Course(
-            id='BIBL101',
-            code='BIBL 101',
-            title='Biblical Studies I',
-            faculty='Dr. Smith',
-            credits=12.0,
-            days='MW',
-            time='10:00-11:30',
-            semester='Fall 2025',
-            delivery_mode='In Person',
-            description='Biblical studies course',
-            satisfies={'bible'}
-        )
-        
-        course2 = Course(
+        course2 = make_course(
             id='THEO201',
             code='THEO 201',
             title='Theology I',
@@ -441,13 +275,10 @@ class TestProgress:
             credits=6.0,
             days='TR',
             time='14:00-15:30',
-            semester='Fall 2025',
-            delivery_mode='In Person',
             description='Theology course',
             satisfies={'theology'}
         )
-        
-        courses = [course1, course2]
+        courses = [bible_course_12, course2]
         
         # Create plan
         plan = Plan()
@@ -460,4 +291,28 @@ class TestProgress:
         assert progress['total_requirements'] == 2
         assert progress['met_requirements'] == 1  # Only bible requirement is met
         assert progress['progress_percentage'] == 50.0
-        assert 'validation_results' in progress 
\ No newline at end of file
+        assert 'validation_results' in progress
+        # A changed plan is summarized afresh
+        plan.remove_course('Fall 2025', 'BIBL101')
+        assert get_requirement_progress(plan, courses, requirements)['met_requirements'] == 0
+    
+    def test_compute_all_matches_separate_scans(self, bible_course_12, theology_course_9, bible_course_6_spring):
+        """Test that the fused plan scan agrees with the individual helpers"""
+        requirements = [
+            Requirement('bible', 'Bible/Sacred Texts', 12.0),
+            Requirement('theology', 'Theology & Ethics', 12.0),
+        ]
+        courses = [bible_course_12, theology_course_9, bible_course_6_spring]
+        plan = Plan()
+        plan.add_course('Fall 2025', 'BIBL101')
+        plan.add_course('Fall 2025', 'THEO201')
+        plan.add_course('Spring 2026', 'BIBL201')
+        plan.add_course('Spring 2026', 'UNKNOWN')
+        
+        summary = compute_all(plan, courses, requirements)
+        
+        assert summary['total_credits'] == calculate_total_credits(plan, courses) == 27.0
+        assert summary['per_semester_credits'] == {'Fall 2025': 21.0, 'Spring 2026': 6.0}
+        assert summary['validation_results'] == validate_requirements(plan, courses, requirements)
+        assert summary['progress']['met_requirements'] == 1
+        assert summary['progress']['progress_percentage'] == 50.0
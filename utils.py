@@ -1,13 +1,38 @@
 """
 Utility functions for the Dual-Degree Course Planner
 """
-from typing import List, Dict, Tuple
+import csv
+import os
+from collections import defaultdict
+from functools import lru_cache
+from itertools import chain
+from typing import Iterator, List, Dict, Tuple, TextIO, Union
 from models import Course, Requirement, Plan
 import pandas as pd
 import json
 from datetime import datetime
 
 
+def _course_lookup(courses: List[Course]) -> Dict[str, Course]:
+    """Course-id -> course dict for ``courses``
+    
+    Built per call: it is cheaper than hashing the list's contents for a cache key,
+    and an id-keyed cache goes stale when the list is mutated in place. Callers that
+    filter one catalog repeatedly hold a models.CourseTable instead.
+    """
+    return {course.id: course for course in courses}
+
+
+def scan_plan(plan: Plan, courses: List[Course]) -> Iterator[Tuple[str, Course]]:
+    """Yield (semester, course) for every selected course found in ``courses``, in plan order"""
+    course_lookup = _course_lookup(courses)
+    for semester, course_ids in plan.selections.items():
+        for course_id in course_ids:
+            course = course_lookup.get(course_id)
+            if course is not None:
+                yield semester, course
+
+
 def validate_requirements(plan: Plan, courses: List[Course], requirements: List[Requirement]) -> Dict[str, Dict]:
     """
     Validate that the plan meets all credit requirements
@@ -15,24 +40,35 @@ def validate_requirements(plan: Plan, courses: List[Course], requirements: List[
     Returns:
         Dict with validation results for each requirement
     """
+    _, _, credits_by_req, picked_by_req = _tally_plan(plan, courses)
+    return _validation_results(requirements, credits_by_req, picked_by_req)
+
+
+def _tally_plan(plan: Plan, courses: List[Course]) -> Tuple[float, Dict[str, float], Dict[str, float], Dict[str, List[Course]]]:
+    """Total credits, credits per semester, and credits and courses per requirement, from one scan of the plan"""
+    total_credits = 0.0
+    per_semester_credits: Dict[str, float] = defaultdict(float)
+    credits_by_req: Dict[str, float] = defaultdict(float)
+    picked_by_req: Dict[str, List[Course]] = defaultdict(list)
+    # Credit each selected course to its semester and to every requirement it satisfies
+    for semester, course in scan_plan(plan, courses):
+        credits = course.credits
+        total_credits += credits
+        per_semester_credits[semester] += credits
+        for req_id in course.satisfies:
+            credits_by_req[req_id] += credits
+            picked_by_req[req_id].append(course)
+    return total_credits, per_semester_credits, credits_by_req, picked_by_req
+
+
+def _validation_results(requirements: List[Requirement], credits_by_req: Dict[str, float],
+                        picked_by_req: Dict[str, List[Course]]) -> Dict[str, Dict]:
+    """Per-requirement validation results from the credits and courses credited to each"""
     validation_results = {}
     
-    # Create course lookup
-    course_lookup = {course.id: course for course in courses}
-    requirement_lookup = {req.id: req for req in requirements}
-    
     for requirement in requirements:
-        selected_courses = []
-        total_credits = 0.0
-        
-        # Find all selected courses that satisfy this requirement
-        for semester, course_ids in plan.selections.items():
-            for course_id in course_ids:
-                if course_id in course_lookup:
-                    course = course_lookup[course_id]
-                    if requirement.id in course.satisfies:
-                        selected_courses.append(course)
-                        total_credits += course.credits
+        selected_courses = picked_by_req.get(requirement.id, [])
+        total_credits = credits_by_req.get(requirement.id, 0.0)
         
         # Check if requirement is met
         is_met = total_credits >= requirement.min_credits
@@ -53,52 +89,71 @@ def validate_requirements(plan: Plan, courses: List[Course], requirements: List[
 
 def calculate_total_credits(plan: Plan, courses: List[Course], semester: str = None) -> float:
     """Calculate total credits for a plan or specific semester"""
-    course_lookup = {course.id: course for course in courses}
-    total = 0.0
+    course_lookup = _course_lookup(courses)
     
     if semester:
         course_ids = plan.get_courses_for_semester(semester)
     else:
-        course_ids = []
-        for semester_courses in plan.selections.values():
-            course_ids.extend(semester_courses)
-    
-    for course_id in course_ids:
-        if course_id in course_lookup:
-            total += course_lookup[course_id].credits
+        course_ids = chain.from_iterable(plan.selections.values())
     
-    return total
+    return sum((course_lookup[course_id].credits for course_id in course_ids if course_id in course_lookup), 0.0)
 
 
-def export_plan_to_csv(plan: Plan, courses: List[Course], filepath: str):
-    """Export the plan to CSV format"""
-    course_lookup = {course.id: course for course in courses}
+CSV_HEADERS = (
+    'Semester',
+    'Course Code',
+    'Course Title',
+    'Faculty',
+    'Credits',
+    'Days',
+    'Time',
+    'Delivery Mode',
+    'Description',
+    'Satisfies Requirements',
+)
+
+
+def _plan_rows(plan: Plan, courses: List[Course]) -> Iterator[Tuple]:
+    """Yield one CSV_HEADERS-ordered row per selected course"""
+    for semester, course in scan_plan(plan, courses):
+        yield (
+            semester,
+            course.code,
+            course.title,
+            course.faculty,
+            course.credits,
+            course.days,
+            course.time,
+            course.delivery_mode,
+            course.description,
+            ', '.join(course.satisfies),
+        )
+
+
+def export_plan_to_csv(plan: Plan, courses: List[Course], filepath: Union[str, TextIO], *, return_df: bool = False):
+    """Export the plan to CSV format (filepath may be a path or a text file object)
     
-    # Prepare data for CSV
-    csv_data = []
+    Rows are written with the csv module; pass return_df=True to also get them
+    back as a DataFrame.
+    """
+    rows = list(_plan_rows(plan, courses))
     
-    for semester, course_ids in plan.selections.items():
-        for course_id in course_ids:
-            if course_id in course_lookup:
-                course = course_lookup[course_id]
-                csv_data.append({
-                    'Semester': semester,
-                    'Course Code': course.code,
-                    'Course Title': course.title,
-                    'Faculty': course.faculty,
-                    'Credits': course.credits,
-                    'Days': course.days,
-                    'Time': course.time,
-                    'Delivery Mode': course.delivery_mode,
-                    'Description': course.description,
-                    'Satisfies Requirements': ', '.join(course.satisfies)
-                })
-    
-    # Create DataFrame and export
-    df = pd.DataFrame(csv_data)
-    df.to_csv(filepath, index=False)
-    
-    return df
+    if isinstance(filepath, str):
+        with open(filepath, 'w', newline='', encoding='utf-8') as f:
+            _write_csv_rows(f, rows)
+    else:
+        _write_csv_rows(filepath, rows)
+    
+    if return_df:
+        return pd.DataFrame.from_records(rows, columns=CSV_HEADERS)
+    return None
+
+
+def _write_csv_rows(f: TextIO, rows: List[Tuple]) -> None:
+    # Same line endings as DataFrame.to_csv
+    writer = csv.writer(f, lineterminator=os.linesep)
+    writer.writerow(CSV_HEADERS)
+    writer.writerows(rows)
 
 
 def get_courses_by_requirement(courses: List[Course], requirement_id: str) -> List[Course]:
@@ -111,8 +166,10 @@ def get_courses_by_semester(courses: List[Course], semester: str) -> List[Course
     return [course for course in courses if course.semester == semester]
 
 
+@lru_cache(maxsize=256)
 def format_time_slot(time_str: str) -> str:
-    """Format time slot for better display"""
+    """Format time slot for better display (memoized; catalogs reuse a handful of slots,
+    and format_time_slot.cache_clear() empties the memo)"""
     if not time_str:
         return "TBD"
     
@@ -125,25 +182,38 @@ def format_time_slot(time_str: str) -> str:
     return time_str
 
 
+_DAY_NAMES = {
+    'M': 'Mon',
+    'T': 'Tue',
+    'W': 'Wed',
+    'R': 'Thu',
+    'F': 'Fri'
+}
+# Expands each day letter to "Name, " in one C-level str.translate pass
+_DAY_TRANSLATION = str.maketrans({day: f"{name}, " for day, name in _DAY_NAMES.items()})
+# Formatted day strings by raw input; schedules only use a handful of day combinations
+_FORMATTED_DAYS: Dict[str, str] = {}
+
+
 def format_days(days_str: str) -> str:
-    """Format days for better display"""
+    """Format days for better display (memoized; format_days.cache_clear() empties the memo)"""
     if not days_str:
         return "TBD"
     
-    day_map = {
-        'M': 'Mon',
-        'T': 'Tue', 
-        'W': 'Wed',
-        'R': 'Thu',
-        'F': 'Fri'
-    }
-    
-    formatted_days = []
-    for day in days_str.strip():
-        if day in day_map:
-            formatted_days.append(day_map[day])
-    
-    return ', '.join(formatted_days) if formatted_days else days_str
+    formatted = _FORMATTED_DAYS.get(days_str)
+    if formatted is None:
+        days = days_str.strip()
+        if days and not days.strip(''.join(_DAY_NAMES)):
+            # Only day letters: translate, then drop the trailing ", "
+            formatted = days.translate(_DAY_TRANSLATION)[:-2]
+        else:
+            formatted_days = [_DAY_NAMES[day] for day in days if day in _DAY_NAMES]
+            formatted = ', '.join(formatted_days) if formatted_days else days_str
+        _FORMATTED_DAYS[days_str] = formatted
+    return formatted
+
+
+format_days.cache_clear = _FORMATTED_DAYS.clear
 
 
 def create_sample_data() -> Tuple[List[Course], List[Requirement]]:
@@ -242,8 +312,10 @@ def create_sample_data() -> Tuple[List[Course], List[Requirement]]:
 
 def get_requirement_progress(plan: Plan, courses: List[Course], requirements: List[Requirement]) -> Dict:
     """Get progress summary for all requirements"""
-    validation = validate_requirements(plan, courses, requirements)
-    
+    return _progress_summary(requirements, validate_requirements(plan, courses, requirements))
+
+
+def _progress_summary(requirements: List[Requirement], validation: Dict[str, Dict]) -> Dict:
     total_requirements = len(requirements)
     met_requirements = sum(1 for result in validation.values() if result['is_met'])
     
@@ -252,4 +324,20 @@ def get_requirement_progress(plan: Plan, courses: List[Course], requirements: Li
         'met_requirements': met_requirements,
         'progress_percentage': (met_requirements / total_requirements * 100) if total_requirements > 0 else 0,
         'validation_results': validation
-    } 
\ No newline at end of file
+    }
+
+
+def compute_all(plan: Plan, courses: List[Course], requirements: List[Requirement]) -> Dict:
+    """Total and per-semester credits, validation results and progress from one scan of the plan
+    
+    Returns:
+        Dict with 'total_credits', 'per_semester_credits', 'validation_results' and 'progress'
+    """
+    total_credits, per_semester_credits, credits_by_req, picked_by_req = _tally_plan(plan, courses)
+    validation = _validation_results(requirements, credits_by_req, picked_by_req)
+    return {
+        'total_credits': total_credits,
+        'per_semester_credits': dict(per_semester_credits),
+        'validation_results': validation,
+        'progress': _progress_summary(requirements, validation),
+    }